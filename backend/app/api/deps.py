@@ -1,8 +1,10 @@
 """FastAPI dependency injection providers for repositories and services."""
 
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.config.settings import Settings, get_settings
@@ -40,6 +42,27 @@ def create_router(resource: str, *, prefix: str | None = None) -> APIRouter:
     )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Response Helpers
+# ─────────────────────────────────────────────────────────────────────────────
+
+
+class ModelResponse(JSONResponse):
+    """
+    JSON response rendered directly from an already-validated Pydantic model.
+
+    FastAPI re-validates returned models against ``response_model`` before
+    serializing them. Route handlers that build their response model themselves
+    can return it wrapped in this class to serialize it once with
+    ``model_dump_json``, while keeping ``response_model`` for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the model to JSON bytes using Pydantic's core serializer."""
+        model: BaseModel = content
+        return model.model_dump_json().encode("utf-8")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Type Aliases for Dependencies
 # ─────────────────────────────────────────────────────────────────────────────
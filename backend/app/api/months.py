@@ -11,7 +11,7 @@ from fastapi.responses import StreamingResponse
 from loguru import logger
 from pydantic import ValidationError
 
-from app.api.deps import MonthRepo, TransactionRepo, create_router
+from app.api.deps import ModelResponse, MonthRepo, TransactionRepo, create_router
 from app.responses.cashflow import CashFlowResponse
 from app.responses.history import HistoryResponse, MonthHistory
 from app.responses.months import (
@@ -50,7 +50,7 @@ def _http_detail_for_db_error(error: MonthDataError) -> str:
 
 
 @router.get("/", response_model=MonthsListResponse)
-def list_months(month_repo: MonthRepo) -> MonthsListResponse:
+def list_months(month_repo: MonthRepo) -> ModelResponse:
     """
     List all months with summary data.
 
@@ -59,8 +59,8 @@ def list_months(month_repo: MonthRepo) -> MonthsListResponse:
 
     Returns
     -------
-    MonthsListResponse
-        List of months with summary data and total count.
+    ModelResponse
+        Serialized MonthsListResponse with summary data and total count.
 
     Raises
     ------
@@ -71,7 +71,7 @@ def list_months(month_repo: MonthRepo) -> MonthsListResponse:
         months_with_counts = months_service.get_all_months_with_counts(month_repo)
         month_summaries = [MonthSummary.from_model(m, tx_count) for m, tx_count in months_with_counts]
 
-        return MonthsListResponse(months=month_summaries, total=len(month_summaries))
+        return ModelResponse(MonthsListResponse(months=month_summaries, total=len(month_summaries)))
     except MonthDataError as error:
         logger.exception("Database error in list_months")
         raise HTTPException(status_code=503, detail=_http_detail_for_db_error(error)) from error
@@ -191,7 +191,7 @@ def get_month_detail(
     end_date: date | None = Query(None, description="Filter transactions until this date"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(25, ge=1, le=100, description="Items per page"),
-) -> MonthDetailResponse:
+) -> ModelResponse:
     """
     Get detailed data for a specific month with filtered transactions.
 
@@ -216,8 +216,8 @@ def get_month_detail(
 
     Returns
     -------
-    MonthDetailResponse
-        Month summary, transactions, and pagination info.
+    ModelResponse
+        Serialized MonthDetailResponse with month summary, transactions, and pagination info.
 
     Raises
     ------
@@ -260,7 +260,11 @@ def get_month_detail(
         # ##>: Use total_items (filtered count) for transaction_count when filters are applied.
         # This provides consistency between transaction_count and pagination.total_items.
         has_filters = any([category, search, start_date, end_date])
-        transaction_count = total_items if has_filters else len(month_record.transactions)
+        transaction_count = (
+            total_items
+            if has_filters
+            else months_service.count_transactions_for_month(transaction_repo, month_record.id)
+        )
 
         month_summary = MonthSummary.from_model(month_record, transaction_count)
 
@@ -275,10 +279,12 @@ def get_month_detail(
             total_pages=total_pages,
         )
 
-        return MonthDetailResponse(
-            month=month_summary,
-            transactions=transaction_responses,
-            pagination=pagination,
+        return ModelResponse(
+            MonthDetailResponse(
+                month=month_summary,
+                transactions=transaction_responses,
+                pagination=pagination,
+            )
         )
     except HTTPException:
         # ##>: Re-raise HTTPException (400, 404) without wrapping.
@@ -2,10 +2,8 @@
 
 from fastapi import HTTPException, Path
 from loguru import logger
-from sqlalchemy import func
 
-from app.api.deps import DbSession, MonthRepo, TransactionRepo, create_router
-from app.db.models.transaction import Transaction
+from app.api.deps import ModelResponse, MonthRepo, TransactionRepo, create_router
 from app.responses.months import MonthSummary, TransactionResponse
 from app.responses.transactions import UpdateTransactionRequest, UpdateTransactionResponse
 from app.services.data import transactions as transactions_service
@@ -22,11 +20,10 @@ router = create_router("transactions")
 @router.patch("/{transaction_id}", response_model=UpdateTransactionResponse)
 def update_transaction(
     request: UpdateTransactionRequest,
-    db: DbSession,
     month_repo: MonthRepo,
     transaction_repo: TransactionRepo,
     transaction_id: int = Path(..., ge=1, description="Transaction ID"),
-) -> UpdateTransactionResponse:
+) -> ModelResponse:
     """
     Update a transaction's Money Map category and subcategory.
 
@@ -42,8 +39,8 @@ def update_transaction(
 
     Returns
     -------
-    UpdateTransactionResponse
-        Updated transaction and recalculated month statistics.
+    ModelResponse
+        Serialized UpdateTransactionResponse with updated transaction and recalculated month statistics.
 
     Raises
     ------
@@ -63,13 +60,15 @@ def update_transaction(
             money_map_subcategory=request.money_map_subcategory,
         )
 
-        # ##>: Get transaction count via explicit query to avoid lazy load.
-        transaction_count = db.query(func.count(Transaction.id)).filter(Transaction.month_id == month.id).scalar()
+        # ##>: Count via SQL COUNT to avoid lazy-loading every transaction of the month.
+        transaction_count = transaction_repo.count_for_month(month.id)
 
-        return UpdateTransactionResponse(
-            success=True,
-            transaction=TransactionResponse.from_model(transaction),
-            updated_month_stats=MonthSummary.from_model(month, transaction_count),
+        return ModelResponse(
+            UpdateTransactionResponse(
+                success=True,
+                transaction=TransactionResponse.from_model(transaction),
+                updated_month_stats=MonthSummary.from_model(month, transaction_count),
+            )
         )
     except TransactionNotFoundError as error:
         logger.warning("Transaction not found: transaction_id={}", transaction_id)
@@ -3,7 +3,7 @@
 from collections.abc import Generator
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config.settings import get_settings
@@ -53,3 +53,25 @@ def init_db() -> None:
 
     DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
     Base.metadata.create_all(bind=engine)
+    sync_transaction_indexes(engine)
+
+
+def sync_transaction_indexes(bind: Engine) -> None:
+    """
+    Bring the transactions table indexes of an existing database up to date.
+
+    ``create_all`` skips tables that already exist, so databases created before an
+    index change never receive it. Each index declared on the model is created if
+    missing, and the single-column month index it superseded is dropped.
+
+    Parameters
+    ----------
+    bind : Engine
+        Engine of the database to upgrade; all changes run in one transaction.
+    """
+    with bind.begin() as connection:
+        for index in Base.metadata.tables["transactions"].indexes:
+            index.create(connection, checkfirst=True)
+
+        # ##>: The composite idx_transactions_month_date_type leads with month_id and replaces this index.
+        connection.execute(text("DROP INDEX IF EXISTS idx_transactions_month"))
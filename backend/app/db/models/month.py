@@ -28,6 +28,9 @@ class Month(Base):
     year: Mapped[int] = mapped_column(Integer, nullable=False)
     month: Mapped[int] = mapped_column(Integer, nullable=False)
 
+    # ##>: Totals, percentages and score are a denormalized cache of the month's transactions.
+    # List/history/advice reads use them without scanning transactions; calculate_and_update_month
+    # refreshes them from one SQL aggregate whenever transactions change.
     total_income: Mapped[float] = mapped_column(Float, default=0.0)
     total_core: Mapped[float] = mapped_column(Float, default=0.0)
     total_choice: Mapped[float] = mapped_column(Float, default=0.0)
@@ -25,7 +25,9 @@ class Transaction(Base):
     __tablename__ = "transactions"
     __table_args__ = (
         CheckConstraint(_MONEY_MAP_CHECK, name="ck_valid_money_map_type"),
-        Index("idx_transactions_month", "month_id"),
+        # ##>: Composite index serves the month detail path (filter by month, type and date, order by date).
+        # Its month_id prefix also covers plain per-month lookups.
+        Index("idx_transactions_month_date_type", "month_id", "date", "money_map_type"),
         Index("idx_transactions_date", "date"),
     )
 
@@ -3,7 +3,7 @@
 from datetime import date
 from typing import Any
 
-from sqlalchemy import case, func
+from sqlalchemy import case, func, insert
 from sqlalchemy.orm import Session
 
 from app.db.enums import MoneyMapType
@@ -128,6 +128,23 @@ class TransactionRepository:
         # [>]: Order by date ascending (oldest first - start of month to end of month).
         return query.order_by(Transaction.date.asc()).all()
 
+    def count_for_month(self, month_id: int) -> int:
+        """
+        Count transactions for a month with a single COUNT query.
+
+        Parameters
+        ----------
+        month_id : int
+            Month ID to count transactions for.
+
+        Returns
+        -------
+        int
+            Number of transactions in the month.
+        """
+        result = self._db.query(func.count(Transaction.id)).filter(Transaction.month_id == month_id).scalar()
+        return result or 0
+
     def aggregate_totals(self, month_id: int) -> tuple[float, float, float]:
         """
         Aggregate income, core, choice totals for a month.
@@ -179,21 +196,23 @@ class TransactionRepository:
         )
         return float(result.income), float(result.core), float(result.choice)
 
-    def add_bulk(self, transactions: list[Transaction]) -> None:
+    def add_bulk_mappings(self, rows: list[dict[str, Any]]) -> None:
         """
-        Add multiple transactions in bulk.
+        Insert multiple transactions from plain column mappings.
 
         Parameters
         ----------
-        transactions : list[Transaction]
-            List of Transaction objects to add.
+        rows : list[dict[str, Any]]
+            Column name to value mappings, one per transaction.
 
         Notes
         -----
-        Uses add_all() for efficiency. Caller should flush/commit as needed.
+        Emits a single Core executemany INSERT, skipping ORM instance construction
+        and the unit of work. Inserted rows are not added to the identity map.
+        Caller should commit as needed.
         """
-        if transactions:
-            self._db.add_all(transactions)
+        if rows:
+            self._db.execute(insert(Transaction), rows)
 
     def delete_for_month(self, month_id: int) -> int:
         """
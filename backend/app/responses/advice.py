@@ -1,10 +1,9 @@
 """Pydantic models for Advice API endpoints."""
 
-import json
 from datetime import datetime
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Self
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 if TYPE_CHECKING:
     from app.services.advice.models import AdviceResponse as ServiceAdviceResponse
@@ -68,11 +67,33 @@ class AdviceData(BaseModel):
     monthly_goal: MonthlyGoalResponse | None = None
     encouragement: str
 
+    @field_validator("recommendations", mode="before")
+    @classmethod
+    def upgrade_legacy_recommendations(cls, value: Any) -> Any:
+        """Convert legacy plain-string recommendations into the structured format."""
+        if not isinstance(value, list):
+            return value
+
+        # ##>: Legacy advice stored each recommendation as a bare string, ranked by list position.
+        return [
+            {
+                "priority": idx + 1,
+                "action": rec,
+                "details": rec,
+                "expected_savings": "Non spécifié",
+                "difficulty": "Modéré",
+            }
+            if isinstance(rec, str)
+            else rec
+            for idx, rec in enumerate(value)
+        ]
+
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """
         Parse AdviceData from stored JSON string.
 
+        Parsing and validation run in a single ``model_validate_json`` pass.
         Handles both new enriched format and legacy format for backward compatibility.
 
         Parameters
@@ -91,94 +112,9 @@ class AdviceData(BaseModel):
             If JSON is malformed or missing required fields.
         """
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as error:
-            raise ValueError(f"Malformed advice JSON: {error}") from error
-
-        try:
-            # ##>: Parse spending patterns (new format).
-            spending_patterns = [
-                SpendingPatternResponse(
-                    pattern_type=sp["pattern_type"],
-                    description=sp["description"],
-                    monthly_cost=sp["monthly_cost"],
-                    occurrences=sp["occurrences"],
-                    insight=sp["insight"],
-                )
-                for sp in data.get("spending_patterns", [])
-            ]
-
-            # ##>: Parse problem areas with optional new fields.
-            problem_areas = [
-                ProblemAreaResponse(
-                    category=pa["category"],
-                    amount=pa["amount"],
-                    trend=pa["trend"],
-                    root_cause=pa.get("root_cause"),
-                    impact=pa.get("impact"),
-                )
-                for pa in data["problem_areas"]
-            ]
-
-            # ##>: Parse recommendations - handle both new dict format and legacy string format.
-            raw_recommendations = data.get("recommendations", [])
-            if raw_recommendations and isinstance(raw_recommendations[0], dict):
-                recommendations = [
-                    RecommendationResponse(
-                        priority=rec["priority"],
-                        action=rec["action"],
-                        details=rec["details"],
-                        expected_savings=rec["expected_savings"],
-                        difficulty=rec["difficulty"],
-                        quick_win=rec.get("quick_win", False),
-                    )
-                    for rec in raw_recommendations
-                ]
-            else:
-                # ##>: Legacy format: recommendations as list of strings.
-                recommendations = [
-                    RecommendationResponse(
-                        priority=idx + 1,
-                        action=rec,
-                        details=rec,
-                        expected_savings="Non spécifié",
-                        difficulty="Modéré",
-                        quick_win=False,
-                    )
-                    for idx, rec in enumerate(raw_recommendations)
-                ]
-
-            # ##>: Parse progress review (new format).
-            progress_review = None
-            if "progress_review" in data:
-                pr = data["progress_review"]
-                progress_review = ProgressReviewResponse(
-                    previous_advice_followed=pr["previous_advice_followed"],
-                    wins=pr.get("wins", []),
-                    areas_for_growth=pr.get("areas_for_growth", []),
-                )
-
-            # ##>: Parse monthly goal (new format).
-            monthly_goal = None
-            if "monthly_goal" in data:
-                mg = data["monthly_goal"]
-                monthly_goal = MonthlyGoalResponse(
-                    objective=mg["objective"],
-                    target_amount=mg["target_amount"],
-                    strategy=mg["strategy"],
-                )
-
-            return cls(
-                analysis=data["analysis"],
-                spending_patterns=spending_patterns,
-                problem_areas=problem_areas,
-                recommendations=recommendations,
-                progress_review=progress_review,
-                monthly_goal=monthly_goal,
-                encouragement=data["encouragement"],
-            )
-        except KeyError as error:
-            raise ValueError(f"Advice JSON missing required field: {error}") from error
+            return cls.model_validate_json(json_str)
+        except ValidationError as error:
+            raise ValueError(f"Invalid advice JSON: {error}") from error
 
     @classmethod
     def from_service_response(cls, response: "ServiceAdviceResponse") -> Self:
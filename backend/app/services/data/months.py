@@ -15,6 +15,9 @@ from app.responses._types import ScoreTrendLiteral
 from app.responses.history import HistorySummary, MonthReference
 from app.services.exceptions import InvalidCategoryTypeError, MonthQueryError, TransactionQueryError
 
+# ##>: Valid money_map_type filter values, computed once instead of per request.
+_VALID_MONEY_MAP_VALUES: frozenset[str] = frozenset(t.value for t in MoneyMapType)
+
 
 def get_all_months_with_counts(month_repo: MonthRepository) -> list[Any]:
     """
@@ -134,11 +137,10 @@ def get_transactions_filtered(
     try:
         # ##>: Validate category types before querying.
         if category_types is not None and len(category_types) > 0:
-            valid_types = {e.value for e in MoneyMapType}
-            invalid_types = [c for c in category_types if c not in valid_types]
+            invalid_types = [c for c in category_types if c not in _VALID_MONEY_MAP_VALUES]
             if invalid_types:
                 logger.warning("Invalid category_types received: {}", invalid_types)
-                raise InvalidCategoryTypeError(invalid_types, list(valid_types))
+                raise InvalidCategoryTypeError(invalid_types, list(_VALID_MONEY_MAP_VALUES))
 
         transactions, total_count = transaction_repo.get_filtered(
             month_id,
@@ -168,6 +170,34 @@ def get_transactions_filtered(
         raise TransactionQueryError(month_id, str(error)) from error
 
 
+def count_transactions_for_month(transaction_repo: TransactionRepository, month_id: int) -> int:
+    """
+    Count all transactions for a month without loading them.
+
+    Parameters
+    ----------
+    transaction_repo : TransactionRepository
+        Repository for transaction data access.
+    month_id : int
+        Month ID to count transactions for.
+
+    Returns
+    -------
+    int
+        Number of transactions in the month.
+
+    Raises
+    ------
+    TransactionQueryError
+        If database query fails.
+    """
+    try:
+        return transaction_repo.count_for_month(month_id)
+    except SQLAlchemyError as error:
+        logger.error("Database error counting transactions for month_id={}: {}", month_id, str(error))
+        raise TransactionQueryError(month_id, str(error)) from error
+
+
 def get_all_transactions_for_month(transaction_repo: TransactionRepository, month_id: int) -> list[Transaction]:
     """
     Retrieve all transactions for a month without pagination.
@@ -8,7 +8,6 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.config.settings import get_settings
 from app.db.models.month import Month
-from app.db.models.transaction import Transaction
 from app.repositories.month import MonthRepository
 from app.repositories.transaction import TransactionRepository
 from app.services.calculation.service import calculate_and_update_month
@@ -338,7 +337,7 @@ class UploadService:
             missing_result_count > 0 indicates a bug in ID mapping or API response.
         """
         result_by_id: dict[int, CategorizationResult] = {r.id: r for r in results}
-        new_transactions = []
+        new_transactions: list[dict[str, Any]] = []
         skipped_count = 0
         missing_result_count = 0
 
@@ -363,19 +362,20 @@ class UploadService:
                 continue
 
             new_transactions.append(
-                Transaction(
-                    month_id=month_id,
-                    date=t.date,
-                    description=t.description,
-                    amount=float(t.amount),
-                    account=t.account,
-                    bankin_category=t.bankin_category,
-                    bankin_subcategory=t.bankin_subcategory,
-                    money_map_type=result.money_map_type.value,
-                    money_map_subcategory=result.money_map_subcategory,
-                )
+                {
+                    "month_id": month_id,
+                    "date": t.date,
+                    "description": t.description,
+                    "amount": float(t.amount),
+                    "account": t.account,
+                    "bankin_category": t.bankin_category,
+                    "bankin_subcategory": t.bankin_subcategory,
+                    "money_map_type": result.money_map_type.value,
+                    "money_map_subcategory": result.money_map_subcategory,
+                }
             )
 
-        transaction_repo.add_bulk(new_transactions)
+        # ##>: Rows are never read back as instances here, so a single Core INSERT replaces per-object flushes.
+        transaction_repo.add_bulk_mappings(new_transactions)
 
         return len(new_transactions), skipped_count, missing_result_count
@@ -1,9 +1,15 @@
-"""Base test class providing database fixtures for unit tests."""
+"""Shared database engine, fixtures and base test class for the test suite."""
 
+from collections.abc import Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from functools import cache
+from typing import Any
 from unittest import TestCase
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Connection, Engine, RootTransaction
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from app.db.database import Base
@@ -14,32 +20,170 @@ from app.db.models.month import Month  # noqa: F401
 from app.db.models.transaction import Transaction  # noqa: F401
 
 
+def create_test_engine() -> Engine:
+    """
+    Create an in-memory SQLite engine with all application tables.
+
+    The pysqlite driver manages transactions itself and breaks SAVEPOINT
+    handling, so the connect/begin hooks hand transaction control back to
+    SQLAlchemy, as documented for the pysqlite dialect. WAL is not available
+    for in-memory databases, so the rollback journal is kept in memory.
+    Foreign key enforcement is left at the SQLite default so constraint
+    tests behave like the application engine.
+
+    Returns
+    -------
+    Engine
+        SQLAlchemy engine with the schema created.
+    """
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _configure_sqlite_connection(dbapi_connection: Any, _connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+        # ##>: Tests commit often; skip syncing and keep the rollback journal and temp tables in memory.
+        dbapi_connection.execute("PRAGMA synchronous=OFF")
+        dbapi_connection.execute("PRAGMA journal_mode=MEMORY")
+        dbapi_connection.execute("PRAGMA temp_store=MEMORY")
+        # ##>: StaticPool hands out a single connection, so holding the database lock costs nothing.
+        dbapi_connection.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@contextmanager
+def count_queries(connection: Connection) -> Iterator[list[str]]:
+    """
+    Record the SQL statements a connection executes inside the block.
+
+    Used to assert that repository calls and relationship access stay within
+    an expected number of queries, so N+1 regressions show up as test failures.
+
+    Parameters
+    ----------
+    connection : Connection
+        Connection to listen on, e.g. ``db_session.connection()``.
+
+    Yields
+    ------
+    list[str]
+        Statements executed so far, filled in as the block runs.
+    """
+    statements: list[str] = []
+
+    def _record(_conn: Connection, _cursor: Any, statement: str, *_args: Any) -> None:
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", _record)
+
+
+@cache
+def _shared_engine() -> Engine:
+    """Return the engine shared by every test in the process, creating the schema on first use."""
+    return create_test_engine()
+
+
+@pytest.fixture(scope="session")
+def db_engine() -> Engine:
+    """
+    Provide the in-memory SQLite engine shared by all tests of the process.
+
+    The schema is created once. Tests are isolated by the outer transaction
+    opened in db_session, not by recreating tables.
+
+    Returns
+    -------
+    Engine
+        SQLAlchemy engine configured for in-memory testing.
+    """
+    return _shared_engine()
+
+
+@pytest.fixture
+def db_session(request: pytest.FixtureRequest, db_engine: Engine) -> Generator[Session, None, None]:
+    """
+    Provide database session for direct assertions.
+
+    The session joins an outer transaction on a dedicated connection, and
+    its own commits and rollbacks run against SAVEPOINTs. Rolling back the
+    outer transaction at teardown leaves the shared database empty for the
+    next test. Tests marked ``no_db`` only read, so they get a plain session
+    without the outer transaction.
+
+    Parameters
+    ----------
+    request : pytest.FixtureRequest
+        Pytest request used to detect the ``no_db`` marker.
+    db_engine : Engine
+        SQLAlchemy engine from db_engine fixture.
+
+    Yields
+    ------
+    Session
+        SQLAlchemy session for database operations.
+    """
+    if request.node.get_closest_marker("no_db") is not None:
+        with Session(bind=db_engine, autoflush=False) as session:
+            yield session
+        return
+
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
 class DatabaseTestCase(TestCase):
     """
     Base test class providing an in-memory SQLite database for testing.
 
-    Each test gets a fresh database with all tables recreated for isolation.
+    The schema is created once per test process. Each test runs in an outer
+    transaction on its own connection, and session commits and rollbacks run
+    against SAVEPOINTs, so rolling back the outer transaction in tearDown
+    leaves the database empty for the next test.
     """
 
-    engine = None
+    engine: Engine
     session: Session
+    _connection: Connection
+    _transaction: RootTransaction
 
     def setUp(self) -> None:
-        """Create a fresh in-memory database and session for each test."""
-        # ##>: Create a new engine for each test to ensure complete isolation.
-        self.engine = create_engine(
-            "sqlite:///:memory:",
-            connect_args={"check_same_thread": False},
-            poolclass=StaticPool,
-        )
-        Base.metadata.create_all(bind=self.engine)
-
-        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
-        self.session = session_factory()
+        """Open an outer transaction and bind a session to it for each test."""
+        self.engine = _shared_engine()
+        self._connection = self.engine.connect()
+        self._transaction = self._connection.begin()
+        self.session = Session(bind=self._connection, autoflush=False, join_transaction_mode="create_savepoint")
 
     def tearDown(self) -> None:
-        """Close the session and drop all tables after each test."""
+        """Close the session and discard everything the test wrote."""
         self.session.close()
-        if self.engine:
-            Base.metadata.drop_all(bind=self.engine)
-            self.engine.dispose()
+        self._transaction.rollback()
+        self._connection.close()
+
+    def count_queries(self) -> AbstractContextManager[list[str]]:
+        """
+        Record the SQL statements the test connection executes inside the block.
+
+        Returns
+        -------
+        AbstractContextManager[list[str]]
+            Context manager yielding the recorded statements; see count_queries.
+        """
+        return count_queries(self._connection)
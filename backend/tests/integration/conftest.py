@@ -1,95 +1,98 @@
 """Integration test fixtures for FastAPI with database."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from importlib.util import find_spec
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import Session
 
-from app.db.database import Base, get_db
-
-# ##>: Import all models to register them with Base.metadata before table creation.
-from app.db.models.advice import Advice  # noqa: F401
-from app.db.models.month import Month  # noqa: F401
-from app.db.models.transaction import Transaction  # noqa: F401
+from app.db.database import get_db
+from app.db.models.month import Month
 from app.main import app
 
+# ##>: Run the TestClient event loop on uvloop when it is installed (dev extra, not available on Windows).
+CLIENT_BACKEND_OPTIONS: dict[str, Any] = {"use_uvloop": True} if find_spec("uvloop") is not None else {}
 
-@pytest.fixture
-def db_engine() -> Generator[Engine, None, None]:
+
+@pytest.fixture(scope="module")
+def app_client() -> Generator[TestClient, None, None]:
     """
-    Create in-memory SQLite engine with all tables.
+    FastAPI TestClient shared by all tests of a module.
 
-    Creates a fresh SQLite database in memory for each test, with all
-    application tables created. Engine is disposed after test completes.
+    Entering the client runs the application lifespan, so it is done once per
+    module rather than once per test. ``init_db`` is patched out of the
+    lifespan so no on-disk database is created. Use the ``client`` fixture in tests,
+    which adds the per-test database override.
 
     Yields
     ------
-    Engine
-        SQLAlchemy engine configured for in-memory testing.
+    TestClient
+        FastAPI test client with the lifespan started.
     """
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(bind=engine)
-    yield engine
-    Base.metadata.drop_all(bind=engine)
-    engine.dispose()
+    # ##>: The lifespan's init_db would create the on-disk database; tests use the in-memory engine instead.
+    with patch("app.main.init_db"), TestClient(app, backend_options=CLIENT_BACKEND_OPTIONS) as test_client:
+        yield test_client
 
 
 @pytest.fixture
-def db_session(db_engine: Engine) -> Generator[Session, None, None]:
+def client(app_client: TestClient, db_session: Session) -> Generator[TestClient, None, None]:
     """
-    Provide database session for direct assertions.
+    Test client with database dependency override.
 
-    Creates a session bound to the test engine, allowing tests to query
-    the database directly to verify state after API operations.
+    Reuses the module-wide TestClient and points ``get_db`` at the test
+    database session. Endpoints and assertions share that session, so rows
+    written by a request are visible without expiring it. Dependency
+    overrides are cleared after each test to prevent interference.
 
     Parameters
     ----------
-    db_engine : Engine
-        SQLAlchemy engine from db_engine fixture.
+    app_client : TestClient
+        Shared TestClient from app_client fixture.
+    db_session : Session
+        SQLAlchemy session from db_session fixture.
 
     Yields
     ------
-    Session
-        SQLAlchemy session for database operations.
+    TestClient
+        FastAPI test client configured for integration testing.
     """
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
-    session = testing_session_local()
-    yield session
-    session.close()
+
+    def override_get_db() -> Generator[Session, None, None]:
+        yield db_session
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield app_client
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture
-def client(db_session: Session) -> Generator[TestClient, None, None]:
+def month_factory(db_session: Session) -> Callable[..., Month]:
     """
-    Test client with database dependency override.
+    Factory for persisted Month records with sensible defaults.
 
-    Creates a FastAPI TestClient that uses the test database session
-    instead of the production database. Dependency overrides are cleared
-    after each test to prevent interference.
+    Defaults to October 2025 with a "Great" score. Any Month column can be
+    overridden through keyword arguments. The month is flushed so its ID is
+    available without committing.
 
     Parameters
     ----------
     db_session : Session
         SQLAlchemy session from db_session fixture.
 
-    Yields
-    ------
-    TestClient
-        FastAPI test client configured for integration testing.
+    Returns
+    -------
+    Callable[..., Month]
+        Function creating and flushing a Month with the given overrides.
     """
 
-    def override_get_db() -> Generator[Session, None, None]:
-        yield db_session
+    def _make(**overrides: Any) -> Month:
+        fields: dict[str, Any] = {"year": 2025, "month": 10, "score": 3, "score_label": "Great", **overrides}
+        month = Month(**fields)
+        db_session.add(month)
+        db_session.flush()
+        return month
 
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
+    return _make
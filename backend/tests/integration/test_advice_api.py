@@ -186,7 +186,6 @@ class TestGenerateThenRetrieveFlow:
 
         client.post("/api/advice/generate", json={"year": 2025, "month": 10})
 
-        db_session.expire_all()
         advice = db_session.query(Advice).filter(Advice.month_id == month.id).first()
 
         assert advice is not None
@@ -228,7 +227,6 @@ class TestGenerateThenRetrieveFlow:
         assert response.status_code == 200
         assert response.json()["was_cached"] is False
 
-        db_session.expire_all()
         advice_count = db_session.query(Advice).filter(Advice.month_id == month.id).count()
         assert advice_count == 1
 
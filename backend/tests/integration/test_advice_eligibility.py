@@ -1,36 +1,51 @@
 """Integration tests for advice eligibility API behavior."""
 
-from unittest.mock import MagicMock, patch
+from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from app.api.deps import get_advice_generator
 from app.db.models.advice import Advice
 from app.db.models.month import Month
+from app.main import app
 from app.services.advice.models import AdviceResponse, ProblemArea, Recommendation
 
 
+def _month_row(year: int, month: int, score: int = 2) -> dict[str, Any]:
+    """Build the column values shared by every test month record."""
+    return {
+        "year": year,
+        "month": month,
+        "total_income": 3000.0,
+        "total_core": 1500.0,
+        "total_choice": 900.0,
+        "total_compound": 600.0,
+        "core_percentage": 50.0,
+        "choice_percentage": 30.0,
+        "compound_percentage": 20.0,
+        "score": score,
+        "score_label": "Okay",
+    }
+
+
 def _create_month(db: Session, year: int, month: int, score: int = 2) -> Month:
     """Create a test month record in the database."""
-    month_record = Month(
-        year=year,
-        month=month,
-        total_income=3000.0,
-        total_core=1500.0,
-        total_choice=900.0,
-        total_compound=600.0,
-        core_percentage=50.0,
-        choice_percentage=30.0,
-        compound_percentage=20.0,
-        score=score,
-        score_label="Okay",
-    )
+    month_record = Month(**_month_row(year, month, score))
     db.add(month_record)
     db.commit()
     db.refresh(month_record)
     return month_record
 
 
+def _create_months(db: Session, year_months: list[tuple[int, int]], score: int = 2) -> None:
+    """Create several test month records with a single executemany INSERT."""
+    db.execute(insert(Month), [_month_row(year, month, score) for year, month in year_months])
+    db.commit()
+
+
 def _create_mock_advice_response() -> AdviceResponse:
     """Create a mock AdviceResponse from AdviceGenerator."""
     return AdviceResponse(
@@ -52,7 +67,49 @@ def _create_mock_advice_response() -> AdviceResponse:
     )
 
 
-MOCK_API_KEY_ENV = {"ANTHROPIC_API_KEY": "test-key-for-integration-tests"}
+# ##>: Canned response built once; the route only reads and serializes it.
+_CANNED_ADVICE = _create_mock_advice_response()
+
+
+class FakeAdviceGenerator:
+    """
+    Stand-in for AdviceGenerator that returns the canned advice.
+
+    Counts calls so tests can check whether generation ran, without the
+    attribute machinery of a MagicMock.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def generate_advice(self, *_args: Any, **_kwargs: Any) -> AdviceResponse:
+        """Record the call and return the canned advice."""
+        self.calls += 1
+        return _CANNED_ADVICE
+
+
+@pytest.fixture
+def fake_generator(client: TestClient) -> FakeAdviceGenerator:
+    """
+    Inject a fake generator in place of AdviceGenerator.
+
+    The override is dropped with the others when the ``client`` fixture tears down.
+
+    Parameters
+    ----------
+    client : TestClient
+        Test client from the client fixture, which owns the dependency overrides.
+
+    Returns
+    -------
+    FakeAdviceGenerator
+        Generator returned by the overridden dependency for this test.
+    """
+    generator = FakeAdviceGenerator()
+    app.dependency_overrides[get_advice_generator] = lambda: generator
+    return generator
 
 
 class TestGetAdviceEligibility:
@@ -61,8 +118,7 @@ class TestGetAdviceEligibility:
     def test_get_advice_returns_eligibility_info(self, client: TestClient, db_session: Session) -> None:
         """GET /api/advice returns eligibility field with can_generate status."""
         # ##>: Create two months - October is most recent, so September and October are eligible.
-        _create_month(db_session, 2025, 9)
-        _create_month(db_session, 2025, 10)
+        _create_months(db_session, [(2025, 9), (2025, 10)])
 
         response = client.get("/api/advice/2025/10")
 
@@ -74,9 +130,8 @@ class TestGetAdviceEligibility:
 
     def test_get_advice_returns_not_eligible_for_old_month(self, client: TestClient, db_session: Session) -> None:
         """GET /api/advice returns can_generate=False for months outside window."""
-        _create_month(db_session, 2025, 8)  # ##>: Old month.
-        _create_month(db_session, 2025, 9)
-        _create_month(db_session, 2025, 10)  # ##>: Most recent.
+        # ##>: August is the old month, October the most recent.
+        _create_months(db_session, [(2025, 8), (2025, 9), (2025, 10)])
 
         response = client.get("/api/advice/2025/8")
 
@@ -92,8 +147,8 @@ class TestGenerateAdviceEligibility:
 
     def test_generate_advice_returns_403_when_not_eligible(self, client: TestClient, db_session: Session) -> None:
         """POST /api/advice/generate returns 403 for ineligible months."""
-        _create_month(db_session, 2025, 8)  # ##>: Old month.
-        _create_month(db_session, 2025, 10)  # ##>: Most recent.
+        # ##>: August is the old month, October the most recent.
+        _create_months(db_session, [(2025, 8), (2025, 10)])
 
         response = client.post("/api/advice/generate", json={"year": 2025, "month": 8})
 
@@ -102,8 +157,8 @@ class TestGenerateAdviceEligibility:
 
     def test_eligibility_reason_included_in_403_response(self, client: TestClient, db_session: Session) -> None:
         """403 response includes clear reason message."""
-        _create_month(db_session, 2025, 7)  # ##>: Old month.
-        _create_month(db_session, 2025, 10)  # ##>: Most recent.
+        # ##>: July is the old month, October the most recent.
+        _create_months(db_session, [(2025, 7), (2025, 10)])
 
         response = client.post("/api/advice/generate", json={"year": 2025, "month": 7})
 
@@ -111,46 +166,31 @@ class TestGenerateAdviceEligibility:
         detail = response.json()["detail"]
         assert "Les conseils ne peuvent être générés que pour les 2 mois les plus récents" in detail
 
-    @patch.dict("os.environ", MOCK_API_KEY_ENV)
-    @patch("app.api.deps.AdviceGenerator")
     def test_generate_advice_uses_dynamic_history_limit(
         self,
-        mock_generator_class: MagicMock,
         client: TestClient,
         db_session: Session,
+        fake_generator: FakeAdviceGenerator,
     ) -> None:
         """Uses eligibility.history_limit to fetch appropriate history."""
         # ##>: Create 4 months of data.
-        for m in range(7, 11):
-            _create_month(db_session, 2025, m)
-
-        mock_generator = MagicMock()
-        mock_generator.generate_advice.return_value = _create_mock_advice_response()
-        mock_generator_class.return_value = mock_generator
+        _create_months(db_session, [(2025, m) for m in range(7, 11)])
 
         response = client.post("/api/advice/generate", json={"year": 2025, "month": 10})
 
         assert response.status_code == 200
         # ##>: First advice uses 12-month limit, should have called generate_advice.
-        mock_generator.generate_advice.assert_called_once()
+        assert fake_generator.calls == 1
 
-    @patch.dict("os.environ", MOCK_API_KEY_ENV)
-    @patch("app.api.deps.AdviceGenerator")
     def test_generate_first_advice_uses_12_month_limit(
         self,
-        mock_generator_class: MagicMock,
         client: TestClient,
         db_session: Session,
+        fake_generator: FakeAdviceGenerator,
     ) -> None:
         """First advice generation uses 12-month history limit."""
         # ##>: Create 13 months of data to verify limit is respected.
-        for m in range(1, 13):
-            _create_month(db_session, 2024, m)
-        _create_month(db_session, 2025, 1)
-
-        mock_generator = MagicMock()
-        mock_generator.generate_advice.return_value = _create_mock_advice_response()
-        mock_generator_class.return_value = mock_generator
+        _create_months(db_session, [(2024, m) for m in range(1, 13)] + [(2025, 1)])
 
         response = client.post("/api/advice/generate", json={"year": 2025, "month": 1})
 
@@ -159,13 +199,11 @@ class TestGenerateAdviceEligibility:
         data = response.json()
         assert data["success"] is True
 
-    @patch.dict("os.environ", MOCK_API_KEY_ENV)
-    @patch("app.api.deps.AdviceGenerator")
     def test_regenerating_first_advice_uses_12_month_limit(
         self,
-        mock_generator_class: MagicMock,
         client: TestClient,
         db_session: Session,
+        fake_generator: FakeAdviceGenerator,
     ) -> None:
         """Regenerating the only advice still uses 12-month limit."""
         month_oct = _create_month(db_session, 2025, 10)
@@ -178,10 +216,6 @@ class TestGenerateAdviceEligibility:
         db_session.add(advice)
         db_session.commit()
 
-        mock_generator = MagicMock()
-        mock_generator.generate_advice.return_value = _create_mock_advice_response()
-        mock_generator_class.return_value = mock_generator
-
         response = client.post("/api/advice/generate", json={"year": 2025, "month": 10, "regenerate": True})
 
         assert response.status_code == 200
@@ -3,6 +3,7 @@
 from datetime import date
 
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db.enums import MoneyMapType
@@ -69,20 +70,25 @@ class TestGetCashFlowEndpoint:
 
     def test_months_zero_fetches_all_months(self, client: TestClient, db_session: Session) -> None:
         """Should return all months when months=0."""
-        for m in range(1, 13):
-            month = Month(year=2025, month=m, score=3, score_label="Great")
-            db_session.add(month)
-            db_session.commit()
-
-            tx = Transaction(
-                month_id=month.id,
-                date=date(2025, m, 1),
-                description="Salary",
-                amount=5000.0,
-                money_map_type=MoneyMapType.INCOME.value,
-                money_map_subcategory="Job",
-            )
-            db_session.add(tx)
+        month_ids = db_session.scalars(
+            insert(Month).returning(Month.id, sort_by_parameter_order=True),
+            [{"year": 2025, "month": m, "score": 3, "score_label": "Great"} for m in range(1, 13)],
+        ).all()
+
+        db_session.execute(
+            insert(Transaction),
+            [
+                {
+                    "month_id": month_id,
+                    "date": date(2025, m, 1),
+                    "description": "Salary",
+                    "amount": 5000.0,
+                    "money_map_type": MoneyMapType.INCOME.value,
+                    "money_map_subcategory": "Job",
+                }
+                for m, month_id in enumerate(month_ids, start=1)
+            ],
+        )
         db_session.commit()
 
         response = client.get("/api/months/cashflow", params={"months": 0})
@@ -98,35 +104,34 @@ class TestGetCashFlowEndpoint:
         db_session.add(month)
         db_session.commit()
 
-        db_session.add(
-            Transaction(
-                month_id=month.id,
-                date=date(2025, 10, 1),
-                description="Salary",
-                amount=3000.0,
-                money_map_type=MoneyMapType.INCOME.value,
-                money_map_subcategory="Job",
-            )
-        )
-        db_session.add(
-            Transaction(
-                month_id=month.id,
-                date=date(2025, 10, 5),
-                description="Rent",
-                amount=-2500.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Housing",
-            )
-        )
-        db_session.add(
-            Transaction(
-                month_id=month.id,
-                date=date(2025, 10, 10),
-                description="Shopping",
-                amount=-1000.0,
-                money_map_type=MoneyMapType.CHOICE.value,
-                money_map_subcategory="Fancy clothing",
-            )
+        db_session.execute(
+            insert(Transaction),
+            [
+                {
+                    "month_id": month.id,
+                    "date": date(2025, 10, 1),
+                    "description": "Salary",
+                    "amount": 3000.0,
+                    "money_map_type": MoneyMapType.INCOME.value,
+                    "money_map_subcategory": "Job",
+                },
+                {
+                    "month_id": month.id,
+                    "date": date(2025, 10, 5),
+                    "description": "Rent",
+                    "amount": -2500.0,
+                    "money_map_type": MoneyMapType.CORE.value,
+                    "money_map_subcategory": "Housing",
+                },
+                {
+                    "month_id": month.id,
+                    "date": date(2025, 10, 10),
+                    "description": "Shopping",
+                    "amount": -1000.0,
+                    "money_map_type": MoneyMapType.CHOICE.value,
+                    "money_map_subcategory": "Fancy clothing",
+                },
+            ],
         )
         db_session.commit()
 
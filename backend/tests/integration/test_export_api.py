@@ -60,20 +60,23 @@ class TestExportJsonEndpoint:
         db_session.commit()
 
         # ##>: Add multiple transactions.
-        for i in range(5):
-            tx = Transaction(
-                month_id=month.id,
-                date=date(2025, 10, i + 1),
-                description=f"Transaction {i + 1}",
-                amount=100.0 * (i + 1),
-                account="Main Account",
-                bankin_category="Test Category",
-                bankin_subcategory="Test Subcategory",
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Groceries",
-                is_manually_corrected=False,
-            )
-            db_session.add(tx)
+        db_session.add_all(
+            [
+                Transaction(
+                    month_id=month.id,
+                    date=date(2025, 10, i + 1),
+                    description=f"Transaction {i + 1}",
+                    amount=100.0 * (i + 1),
+                    account="Main Account",
+                    bankin_category="Test Category",
+                    bankin_subcategory="Test Subcategory",
+                    money_map_type=MoneyMapType.CORE.value,
+                    money_map_subcategory="Groceries",
+                    is_manually_corrected=False,
+                )
+                for i in range(5)
+            ]
+        )
         db_session.commit()
 
         response = client.get("/api/months/2025/10/export/json")
@@ -313,15 +316,18 @@ class TestExportCsvEndpoint:
         db_session.add(month)
         db_session.commit()
 
-        for i in range(5):
-            tx = Transaction(
-                month_id=month.id,
-                date=date(2025, 10, i + 1),
-                description=f"Transaction {i + 1}",
-                amount=100.0,
-                money_map_type=MoneyMapType.CORE.value,
-            )
-            db_session.add(tx)
+        db_session.add_all(
+            [
+                Transaction(
+                    month_id=month.id,
+                    date=date(2025, 10, i + 1),
+                    description=f"Transaction {i + 1}",
+                    amount=100.0,
+                    money_map_type=MoneyMapType.CORE.value,
+                )
+                for i in range(5)
+            ]
+        )
         db_session.commit()
 
         response = client.get("/api/months/2025/10/export/csv")
@@ -3,6 +3,7 @@
 from unittest.mock import patch
 
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db.models.month import Month
@@ -148,8 +149,9 @@ class TestGetHistoryEndpoint:
     def test_history_months_zero_returns_all(self, client: TestClient, db_session: Session) -> None:
         """Should return all months when months=0."""
         # ##>: Create test months.
-        for i in range(1, 4):
-            db_session.add(Month(year=2025, month=i, score=2, score_label="Okay"))
+        db_session.execute(
+            insert(Month), [{"year": 2025, "month": i, "score": 2, "score_label": "Okay"} for i in range(1, 4)]
+        )
         db_session.commit()
 
         response = client.get("/api/months/history", params={"months": 0})
@@ -1,23 +1,74 @@
 """Integration tests for months API endpoints."""
 
+from collections.abc import Callable
 from datetime import date
+from typing import Any
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.db.enums import MoneyMapType
 from app.db.models.month import Month
 from app.db.models.transaction import Transaction
 
+# ##>: Enum values bound once at import for building test rows.
+INCOME = MoneyMapType.INCOME.value
+CORE = MoneyMapType.CORE.value
+CHOICE = MoneyMapType.CHOICE.value
+
+MonthFactory = Callable[..., Month]
+
+# ##>: Shared dataset for filter tests; each case selects a different subset of these rows.
+_FILTER_DATASET: tuple[dict[str, Any], ...] = (
+    {
+        "date": date(2025, 10, 1),
+        "description": "SALARY FROM COMPANY",
+        "amount": 5000.0,
+        "money_map_type": INCOME,
+    },
+    {
+        "date": date(2025, 10, 5),
+        "description": "GROCERY STORE",
+        "amount": -100.0,
+        "money_map_type": CORE,
+    },
+    {
+        "date": date(2025, 10, 10),
+        "description": "CARREFOUR GROCERIES",
+        "amount": -150.0,
+        "money_map_type": CORE,
+    },
+    {
+        "date": date(2025, 10, 15),
+        "description": "GROCERY MARKET",
+        "amount": -50.0,
+        "money_map_type": CHOICE,
+    },
+    {
+        "date": date(2025, 10, 25),
+        "description": "RESTAURANT",
+        "amount": -80.0,
+        "money_map_type": CORE,
+    },
+    {
+        "date": date(2025, 10, 30),
+        "description": "RENT",
+        "amount": -1500.0,
+        "money_map_type": CORE,
+    },
+)
+
 
 class TestListMonthsEndpoint:
     """Tests for GET /api/months endpoint."""
 
-    def test_returns_list_with_correct_structure(self, client: TestClient, db_session: Session) -> None:
+    def test_returns_list_with_correct_structure(
+        self, client: TestClient, db_session: Session, month_factory: MonthFactory
+    ) -> None:
         """Should return list of months with correct response structure."""
-        month = Month(
-            year=2025,
-            month=10,
+        month = month_factory(
             total_income=5000.0,
             total_core=2000.0,
             total_choice=1000.0,
@@ -25,11 +76,7 @@ class TestListMonthsEndpoint:
             core_percentage=40.0,
             choice_percentage=20.0,
             compound_percentage=40.0,
-            score=3,
-            score_label="Great",
         )
-        db_session.add(month)
-        db_session.commit()
 
         # ##>: Add a transaction to verify transaction_count.
         tx = Transaction(
@@ -37,7 +84,7 @@ class TestListMonthsEndpoint:
             date=date(2025, 10, 1),
             description="Salary",
             amount=5000.0,
-            money_map_type=MoneyMapType.INCOME.value,
+            money_map_type=INCOME,
         )
         db_session.add(tx)
         db_session.commit()
@@ -58,6 +105,7 @@ class TestListMonthsEndpoint:
         assert month_data["score_label"] == "Great"
         assert month_data["transaction_count"] == 1
 
+    @pytest.mark.no_db
     def test_returns_empty_list_when_no_months(self, client: TestClient) -> None:
         """Should return empty list when no months exist."""
         response = client.get("/api/months")
@@ -71,6 +119,7 @@ class TestListMonthsEndpoint:
 class TestGetMonthDetailEndpoint:
     """Tests for GET /api/months/{year}/{month} endpoint."""
 
+    @pytest.mark.no_db
     def test_returns_404_when_not_found(self, client: TestClient) -> None:
         """Should return 404 when month does not exist."""
         response = client.get("/api/months/2025/10")
@@ -78,11 +127,11 @@ class TestGetMonthDetailEndpoint:
         assert response.status_code == 404
         assert "2025-10" in response.json()["detail"]
 
-    def test_returns_paginated_transactions(self, client: TestClient, db_session: Session) -> None:
+    def test_returns_paginated_transactions(
+        self, client: TestClient, db_session: Session, month_factory: MonthFactory
+    ) -> None:
         """Should return month detail with paginated transactions."""
-        month = Month(
-            year=2025,
-            month=10,
+        month = month_factory(
             total_income=5000.0,
             total_core=2000.0,
             total_choice=1000.0,
@@ -90,22 +139,22 @@ class TestGetMonthDetailEndpoint:
             core_percentage=40.0,
             choice_percentage=20.0,
             compound_percentage=40.0,
-            score=3,
-            score_label="Great",
         )
-        db_session.add(month)
-        db_session.commit()
 
-        # ##>: Add multiple transactions.
-        for i in range(5):
-            tx = Transaction(
-                month_id=month.id,
-                date=date(2025, 10, i + 1),
-                description=f"Transaction {i + 1}",
-                amount=100.0 * (i + 1),
-                money_map_type=MoneyMapType.CORE.value,
-            )
-            db_session.add(tx)
+        # ##>: Add multiple transactions in a single executemany INSERT.
+        db_session.execute(
+            insert(Transaction),
+            [
+                {
+                    "month_id": month.id,
+                    "date": date(2025, 10, i + 1),
+                    "description": f"Transaction {i + 1}",
+                    "amount": 100.0 * (i + 1),
+                    "money_map_type": CORE,
+                }
+                for i in range(5)
+            ],
+        )
         db_session.commit()
 
         response = client.get("/api/months/2025/10", params={"page": 1, "page_size": 2})
@@ -125,63 +174,62 @@ class TestGetMonthDetailEndpoint:
         assert data["pagination"]["total_items"] == 5
         assert data["pagination"]["total_pages"] == 3
 
-    def test_filters_by_category(self, client: TestClient, db_session: Session) -> None:
-        """Should filter transactions by category query parameter."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
-
-        # ##>: Add transactions with different categories.
-        tx_income = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 1),
-            description="Salary",
-            amount=5000.0,
-            money_map_type=MoneyMapType.INCOME.value,
-        )
-        tx_core = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 5),
-            description="Rent",
-            amount=-1500.0,
-            money_map_type=MoneyMapType.CORE.value,
-        )
-        tx_choice = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 10),
-            description="Restaurant",
-            amount=-50.0,
-            money_map_type=MoneyMapType.CHOICE.value,
-        )
-        db_session.add_all([tx_income, tx_core, tx_choice])
+    @pytest.mark.parametrize(
+        ("params", "expected_descriptions"),
+        [
+            pytest.param(
+                {"category": "CORE"},
+                ["GROCERY STORE", "CARREFOUR GROCERIES", "RESTAURANT", "RENT"],
+                id="category",
+            ),
+            pytest.param({"search": "carrefour"}, ["CARREFOUR GROCERIES"], id="search"),
+            pytest.param(
+                {"start_date": "2025-10-05", "end_date": "2025-10-25"},
+                ["GROCERY STORE", "CARREFOUR GROCERIES", "GROCERY MARKET", "RESTAURANT"],
+                id="date_range",
+            ),
+            pytest.param({"category": "CORE", "search": "grocery"}, ["GROCERY STORE"], id="combined"),
+        ],
+    )
+    def test_filters_transactions(
+        self,
+        client: TestClient,
+        db_session: Session,
+        month_factory: MonthFactory,
+        params: dict[str, str],
+        expected_descriptions: list[str],
+    ) -> None:
+        """Should apply category, search and date filters with AND logic via query parameters."""
+        month = month_factory()
+        db_session.execute(insert(Transaction), [{"month_id": month.id, **row} for row in _FILTER_DATASET])
         db_session.commit()
 
-        response = client.get("/api/months/2025/10", params={"category": "CORE"})
+        response = client.get("/api/months/2025/10", params=params)
 
         assert response.status_code == 200
         data = response.json()
-        assert data["pagination"]["total_items"] == 1
-        assert len(data["transactions"]) == 1
-        assert data["transactions"][0]["money_map_type"] == "CORE"
+        assert data["pagination"]["total_items"] == len(expected_descriptions)
+        assert [tx["description"] for tx in data["transactions"]] == expected_descriptions
 
+    @pytest.mark.no_db
     def test_invalid_month_returns_422(self, client: TestClient) -> None:
         """Should return 422 for invalid month number (> 12)."""
         response = client.get("/api/months/2025/13")
 
         assert response.status_code == 422
 
-    def test_invalid_category_returns_400(self, client: TestClient, db_session: Session) -> None:
+    def test_invalid_category_returns_400(
+        self, client: TestClient, db_session: Session, month_factory: MonthFactory
+    ) -> None:
         """Should return 400 with clear error message for invalid category values."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
+        month = month_factory()
 
         tx = Transaction(
             month_id=month.id,
             date=date(2025, 10, 1),
             description="Test",
             amount=100.0,
-            money_map_type=MoneyMapType.CORE.value,
+            money_map_type=CORE,
         )
         db_session.add(tx)
         db_session.commit()
@@ -196,36 +244,7 @@ class TestGetMonthDetailEndpoint:
         assert "Valid types" in detail
         assert "CORE" in detail
 
-    def test_search_filter(self, client: TestClient, db_session: Session) -> None:
-        """Should filter transactions by search query parameter."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
-
-        tx1 = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 1),
-            description="SALARY FROM COMPANY",
-            amount=5000.0,
-            money_map_type=MoneyMapType.INCOME.value,
-        )
-        tx2 = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 5),
-            description="CARREFOUR GROCERIES",
-            amount=-150.0,
-            money_map_type=MoneyMapType.CORE.value,
-        )
-        db_session.add_all([tx1, tx2])
-        db_session.commit()
-
-        response = client.get("/api/months/2025/10", params={"search": "carrefour"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["pagination"]["total_items"] == 1
-        assert "CARREFOUR" in data["transactions"][0]["description"]
-
+    @pytest.mark.no_db
     def test_returns_404_with_contextual_message(self, client: TestClient) -> None:
         """Should return 404 with contextual error message including year and month."""
         response = client.get("/api/months/2025/10")
@@ -235,39 +254,9 @@ class TestGetMonthDetailEndpoint:
         assert "2025-10" in detail
         assert "upload" in detail.lower()
 
-    def test_date_range_filter(self, client: TestClient, db_session: Session) -> None:
-        """Should filter transactions by start_date and end_date query parameters."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
-
-        # ##>: Add transactions on different days.
-        for day in [1, 10, 20, 30]:
-            tx = Transaction(
-                month_id=month.id,
-                date=date(2025, 10, day),
-                description=f"Transaction on {day}th",
-                amount=100.0,
-                money_map_type=MoneyMapType.CORE.value,
-            )
-            db_session.add(tx)
-        db_session.commit()
-
-        response = client.get(
-            "/api/months/2025/10",
-            params={"start_date": "2025-10-05", "end_date": "2025-10-25"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        # ##>: Only transactions on 10th and 20th should match.
-        assert data["pagination"]["total_items"] == 2
-
-    def test_invalid_date_range_returns_400(self, client: TestClient, db_session: Session) -> None:
+    def test_invalid_date_range_returns_400(self, client: TestClient, month_factory: MonthFactory) -> None:
         """Should return 400 when start_date is after end_date."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
+        month_factory()
 
         response = client.get(
             "/api/months/2025/10",
@@ -279,54 +268,11 @@ class TestGetMonthDetailEndpoint:
         assert "start_date" in detail
         assert "end_date" in detail
 
-    def test_combined_filters(self, client: TestClient, db_session: Session) -> None:
-        """Should apply multiple filters with AND logic via query parameters."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
-
-        tx1 = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 5),
-            description="GROCERY STORE",
-            amount=-100.0,
-            money_map_type=MoneyMapType.CORE.value,
-        )
-        tx2 = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 15),
-            description="GROCERY MARKET",
-            amount=-50.0,
-            money_map_type=MoneyMapType.CHOICE.value,
-        )
-        tx3 = Transaction(
-            month_id=month.id,
-            date=date(2025, 10, 25),
-            description="RESTAURANT",
-            amount=-80.0,
-            money_map_type=MoneyMapType.CORE.value,
-        )
-        db_session.add_all([tx1, tx2, tx3])
-        db_session.commit()
-
-        # ##>: Filter by CORE category AND "grocery" search.
-        response = client.get(
-            "/api/months/2025/10",
-            params={"category": "CORE", "search": "grocery"},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["pagination"]["total_items"] == 1
-        assert data["transactions"][0]["description"] == "GROCERY STORE"
-
     def test_returns_empty_transactions_for_month_with_no_transactions(
-        self, client: TestClient, db_session: Session
+        self, client: TestClient, month_factory: MonthFactory
     ) -> None:
         """Should return month detail with empty transactions when month has no transactions."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
+        month_factory()
 
         response = client.get("/api/months/2025/10")
 
@@ -337,22 +283,25 @@ class TestGetMonthDetailEndpoint:
         assert data["pagination"]["total_items"] == 0
         assert data["pagination"]["total_pages"] == 0
 
-    def test_returns_empty_transactions_when_page_exceeds_total(self, client: TestClient, db_session: Session) -> None:
+    def test_returns_empty_transactions_when_page_exceeds_total(
+        self, client: TestClient, db_session: Session, month_factory: MonthFactory
+    ) -> None:
         """Should return empty transaction list when page number exceeds available pages."""
-        month = Month(year=2025, month=10, score=3, score_label="Great")
-        db_session.add(month)
-        db_session.commit()
+        month = month_factory()
 
         # ##>: Add only 2 transactions.
-        for i in range(2):
-            tx = Transaction(
-                month_id=month.id,
-                date=date(2025, 10, i + 1),
-                description=f"Transaction {i + 1}",
-                amount=100.0,
-                money_map_type=MoneyMapType.CORE.value,
-            )
-            db_session.add(tx)
+        db_session.add_all(
+            [
+                Transaction(
+                    month_id=month.id,
+                    date=date(2025, 10, i + 1),
+                    description=f"Transaction {i + 1}",
+                    amount=100.0,
+                    money_map_type=CORE,
+                )
+                for i in range(2)
+            ]
+        )
         db_session.commit()
 
         # ##>: Request page 10 with page_size=2 (only 1 page exists).
@@ -9,6 +9,9 @@ from app.db.enums import MoneyMapType
 from app.db.models.month import Month
 from app.db.models.transaction import Transaction
 
+# ##>: Enum values bound once at import for building test rows.
+CHOICE = MoneyMapType.CHOICE.value
+
 
 def _create_month_with_transaction(db: Session) -> tuple[Month, Transaction]:
     """Create a month with a test transaction for integration testing."""
@@ -33,7 +36,7 @@ def _create_month_with_transaction(db: Session) -> tuple[Month, Transaction]:
         date=date(2025, 1, 15),
         description="Test Transaction",
         amount=-50.0,
-        money_map_type=MoneyMapType.CHOICE.value,
+        money_map_type=CHOICE,
         money_map_subcategory="Dining out",
         is_manually_corrected=False,
     )
@@ -1,10 +1,13 @@
 """Integration tests for upload and categorize API endpoints."""
 
 import os
+from math import ceil
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from app.db.enums import MoneyMapType
@@ -16,130 +19,183 @@ from tests.integration.fixtures.csv_builder import CSVBuilder, combine_csvs
 # ##>: Fixture to mock the API key environment variable for categorization tests.
 MOCK_API_KEY_ENV = {"ANTHROPIC_API_KEY": "test-key"}
 
-
-def _create_mock_categorizer(money_map_types: list[MoneyMapType] | None = None) -> MagicMock:
+# ##>: Month lookup built once at module level so every assertion reuses SQLAlchemy's compiled statement cache.
+_MONTH_BY_YEAR_MONTH = select(Month).where(Month.year == bindparam("year"), Month.month == bindparam("month"))
+
+# ##>: CSV payloads built once at import; tests post these bytes instead of rebuilding them.
+CSV_2025_01_FULL_MONTH = (
+    CSVBuilder("2025-01")
+    .add_income("Salary January", 3000)
+    .add_grocery("CARREFOUR", 150)
+    .add_dining("MCDONALDS", 25)
+    .add_savings("Epargne mensuelle", 500)
+    .build()
+)
+CSV_2025_02_OLD_SALARY = CSVBuilder("2025-02").add_income("Old Salary", 2000).build()
+CSV_2025_02_NEW_SALARY = CSVBuilder("2025-02").add_income("New Salary", 3500).build()
+CSV_2025_03_INCOME_GROCERY = CSVBuilder("2025-03").add_income("Salary March", 3000).add_grocery("AUCHAN", 200).build()
+CSV_2025_04_INCOME = CSVBuilder("2025-04").add_income("Salary", 3000).build()
+CSV_2025_04_GROCERY = CSVBuilder("2025-04").add_grocery("LIDL", 120).build()
+# ##>: Two-month file shared by the multi-month and partial failure tests.
+CSV_2025_06_07_COMBINED = combine_csvs(
+    CSVBuilder("2025-06").add_income("Salary Jun", 3000).add_grocery("CARREFOUR", 180).build(),
+    CSVBuilder("2025-07").add_income("Salary Jul", 3100).add_dining("Restaurant", 45).build(),
+)
+CSV_2025_10_INCOME = CSVBuilder("2025-10").add_income("Salary", 3000).build()
+
+
+class StubCategorizer:
     """
-    Create a mock categorizer that returns deterministic results.
+    Deterministic stand-in for TransactionCategorizer.
+
+    Assigns the configured types to transactions in round-robin order with
+    high confidence. Plain method dispatch keeps it cheaper than a MagicMock.
 
     Parameters
     ----------
     money_map_types : list[MoneyMapType] | None
         Types to assign to each transaction. If None, uses INCOME for all.
-
-    Returns
-    -------
-    MagicMock
-        Mock categorizer instance.
     """
-    from math import ceil
 
-    mock_categorizer = MagicMock()
-
-    def categorize_side_effect(inputs: list[Any]) -> tuple[list[CategorizationResult], int]:
-        types = money_map_types or [MoneyMapType.INCOME] * len(inputs)
-        results = [
-            CategorizationResult(
+    def __init__(self, money_map_types: list[MoneyMapType] | None = None) -> None:
+        self._types = money_map_types or [MoneyMapType.INCOME]
+        # ##>: Results only depend on the batch size, so each size is built once per stub.
+        self._results_by_size: dict[int, list[CategorizationResult]] = {}
+
+    def categorize(self, inputs: list[Any]) -> tuple[list[CategorizationResult], int]:
+        """Return one result per input and the batch count a real categorizer would report."""
+        size = len(inputs)
+        results = self._results_by_size.get(size)
+        if results is None:
+            results = self._results_by_size[size] = self._build_results(size)
+        return results, ceil(size / 50)
+
+    def _build_results(self, size: int) -> list[CategorizationResult]:
+        """Build results for IDs 1..size, cycling through the configured types."""
+        types = self._types
+        # ##>: Stub data is trusted, so model_construct skips field validation.
+        return [
+            CategorizationResult.model_construct(
                 id=i + 1,
                 money_map_type=types[i % len(types)],
                 money_map_subcategory="",
                 confidence=0.95,
             )
-            for i in range(len(inputs))
+            for i in range(size)
         ]
-        # ##>: Return tuple (results, api_call_count) matching new signature.
-        api_calls = ceil(len(inputs) / 50) if inputs else 0
-        return results, api_calls
 
-    mock_categorizer.categorize.side_effect = categorize_side_effect
-    return mock_categorizer
+
+class FailingCategorizer(StubCategorizer):
+    """
+    Categorizer stub that raises CategorizationError after some successful calls.
+
+    Parameters
+    ----------
+    successful_calls : int
+        Number of calls answered with INCOME results before failing.
+    message : str
+        Error message carried by the raised CategorizationError.
+    """
+
+    def __init__(self, successful_calls: int, message: str) -> None:
+        super().__init__()
+        self._remaining = successful_calls
+        self._message = message
+
+    def categorize(self, inputs: list[Any]) -> tuple[list[CategorizationResult], int]:
+        """Categorize like StubCategorizer until the successful calls run out, then raise."""
+        if self._remaining == 0:
+            raise CategorizationError(self._message)
+        self._remaining -= 1
+        return super().categorize(inputs)
+
+
+def _create_mock_categorizer(money_map_types: list[MoneyMapType] | None = None) -> StubCategorizer:
+    """
+    Create a categorizer stub that returns deterministic results.
+
+    Parameters
+    ----------
+    money_map_types : list[MoneyMapType] | None
+        Types to assign to each transaction. If None, uses INCOME for all.
+
+    Returns
+    -------
+    StubCategorizer
+        Stub categorizer instance.
+    """
+    return StubCategorizer(money_map_types)
 
 
 @patch.dict(os.environ, MOCK_API_KEY_ENV)
 class TestCategorizeReplaceMode:
     """Integration tests for replace mode categorization."""
 
+    @pytest.mark.parametrize(
+        ("money_map_types", "uploads", "year_month", "expected_count", "expected_totals"),
+        [
+            pytest.param(
+                [MoneyMapType.INCOME, MoneyMapType.CORE, MoneyMapType.CHOICE, MoneyMapType.COMPOUND],
+                (CSV_2025_01_FULL_MONTH,),
+                (2025, 1),
+                4,
+                # ##>: Compound is derived as income - core - choice (what remains after spending).
+                {"total_income": 3000.0, "total_core": 150.0, "total_choice": 25.0, "total_compound": 2825.0},
+                id="creates_month_with_transactions",
+            ),
+            pytest.param(
+                [MoneyMapType.INCOME],
+                (CSV_2025_02_OLD_SALARY, CSV_2025_02_NEW_SALARY),
+                (2025, 2),
+                1,
+                {"total_income": 3500.0},
+                id="deletes_existing_data",
+            ),
+        ],
+    )
     @patch("app.services.upload.service.TransactionCategorizer")
-    def test_upload_categorize_creates_month_with_transactions(
-        self, mock_categorizer_class: MagicMock, client: TestClient, db_session: Session
+    def test_replace_mode_persists_last_upload(
+        self,
+        mock_categorizer_class: MagicMock,
+        client: TestClient,
+        db_session: Session,
+        money_map_types: list[MoneyMapType],
+        uploads: tuple[bytes, ...],
+        year_month: tuple[int, int],
+        expected_count: int,
+        expected_totals: dict[str, float],
     ) -> None:
         """
         Full upload → categorize → verify database flow in replace mode.
 
         Verifies that:
         1. POST /api/categorize succeeds with 200
-        2. Month record is created with correct year/month
+        2. Each upload replaces the month data left by the previous one
         3. Transactions are persisted with correct Money Map types
         4. Score is calculated and returned
         """
-        mock_categorizer_class.return_value = _create_mock_categorizer(
-            [MoneyMapType.INCOME, MoneyMapType.CORE, MoneyMapType.CHOICE, MoneyMapType.COMPOUND]
-        )
+        mock_categorizer_class.return_value = _create_mock_categorizer(money_map_types)
+        year, month_number = year_month
+        params = {"months_to_process": f"{year}-{month_number:02d}", "import_mode": "replace"}
 
-        csv = (
-            CSVBuilder("2025-01")
-            .add_income("Salary January", 3000)
-            .add_grocery("CARREFOUR", 150)
-            .add_dining("MCDONALDS", 25)
-            .add_savings("Epargne mensuelle", 500)
-            .build()
-        )
-
-        response = client.post(
-            "/api/categorize",
-            files={"file": ("test.csv", csv, "text/csv")},
-            params={"months_to_process": "2025-01", "import_mode": "replace"},
-        )
+        for csv in uploads:
+            response = client.post("/api/categorize", files={"file": ("test.csv", csv, "text/csv")}, params=params)
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert len(data["months_processed"]) == 1
-        assert data["months_processed"][0]["transactions_categorized"] == 4
+        assert data["months_processed"][0]["transactions_categorized"] == expected_count
         assert data["total_api_calls"] >= 1
 
         # ##>: Verify database state.
-        db_session.expire_all()
-        month = db_session.query(Month).filter_by(year=2025, month=1).first()
+        month = db_session.execute(_MONTH_BY_YEAR_MONTH, {"year": year, "month": month_number}).scalar_one_or_none()
         assert month is not None
-        assert len(month.transactions) == 4
-        assert month.total_income == 3000.0
-        assert month.total_core == 150.0
-        assert month.total_choice == 25.0
-        # ##>: Compound is derived as income - core - choice (what remains after spending).
-        assert month.total_compound == 3000.0 - 150.0 - 25.0
+        assert len(month.transactions) == expected_count
+        for column, expected in expected_totals.items():
+            assert getattr(month, column) == expected
         assert month.score is not None
 
-    @patch("app.services.upload.service.TransactionCategorizer")
-    def test_replace_mode_deletes_existing_data(
-        self, mock_categorizer_class: MagicMock, client: TestClient, db_session: Session
-    ) -> None:
-        """Replace mode deletes existing month data before import."""
-        mock_categorizer_class.return_value = _create_mock_categorizer([MoneyMapType.INCOME])
-
-        csv_first = CSVBuilder("2025-02").add_income("Old Salary", 2000).build()
-        csv_second = CSVBuilder("2025-02").add_income("New Salary", 3500).build()
-
-        # ##>: First upload.
-        client.post(
-            "/api/categorize",
-            files={"file": ("first.csv", csv_first, "text/csv")},
-            params={"months_to_process": "2025-02", "import_mode": "replace"},
-        )
-
-        # ##>: Second upload replaces first.
-        response = client.post(
-            "/api/categorize",
-            files={"file": ("second.csv", csv_second, "text/csv")},
-            params={"months_to_process": "2025-02", "import_mode": "replace"},
-        )
-
-        assert response.status_code == 200
-        db_session.expire_all()
-        month = db_session.query(Month).filter_by(year=2025, month=2).first()
-        assert month is not None
-        assert month.total_income == 3500.0
-        assert len(month.transactions) == 1
-
 
 @patch.dict(os.environ, MOCK_API_KEY_ENV)
 class TestCategorizeMergeMode:
@@ -159,7 +215,7 @@ class TestCategorizeMergeMode:
         """
         mock_categorizer_class.return_value = _create_mock_categorizer([MoneyMapType.INCOME, MoneyMapType.CORE])
 
-        csv = CSVBuilder("2025-03").add_income("Salary March", 3000).add_grocery("AUCHAN", 200).build()
+        csv = CSV_2025_03_INCOME_GROCERY
 
         # ##>: First upload with replace mode.
         client.post(
@@ -179,8 +235,7 @@ class TestCategorizeMergeMode:
         # ##>: No new transactions should be added (all duplicates).
         assert response.json()["months_processed"][0]["transactions_categorized"] == 0
 
-        db_session.expire_all()
-        month = db_session.query(Month).filter_by(year=2025, month=3).first()
+        month = db_session.execute(_MONTH_BY_YEAR_MONTH, {"year": 2025, "month": 3}).scalar_one_or_none()
         assert month is not None
         assert len(month.transactions) == 2
 
@@ -191,7 +246,7 @@ class TestCategorizeMergeMode:
         """Merge mode adds new transactions while preserving existing ones."""
         mock_categorizer_class.return_value = _create_mock_categorizer([MoneyMapType.INCOME])
 
-        csv_first = CSVBuilder("2025-04").add_income("Salary", 3000).build()
+        csv_first = CSV_2025_04_INCOME
 
         # ##>: First upload.
         client.post(
@@ -202,7 +257,7 @@ class TestCategorizeMergeMode:
 
         # ##>: Reset mock for second upload with different type.
         mock_categorizer_class.return_value = _create_mock_categorizer([MoneyMapType.CORE])
-        csv_second = CSVBuilder("2025-04").add_grocery("LIDL", 120).build()
+        csv_second = CSV_2025_04_GROCERY
 
         # ##>: Second upload merges new data.
         response = client.post(
@@ -214,8 +269,7 @@ class TestCategorizeMergeMode:
         assert response.status_code == 200
         assert response.json()["months_processed"][0]["transactions_categorized"] == 1
 
-        db_session.expire_all()
-        month = db_session.query(Month).filter_by(year=2025, month=4).first()
+        month = db_session.execute(_MONTH_BY_YEAR_MONTH, {"year": 2025, "month": 4}).scalar_one_or_none()
         assert month is not None
         assert len(month.transactions) == 2
         assert month.total_income == 3000.0
@@ -239,10 +293,7 @@ class TestMultiMonthProcessing:
             [MoneyMapType.INCOME, MoneyMapType.CORE, MoneyMapType.CHOICE]
         )
 
-        # ##>: Build CSV with two months of data.
-        csv_june = CSVBuilder("2025-06").add_income("Salary Jun", 3000).add_grocery("CARREFOUR", 180).build()
-        csv_july = CSVBuilder("2025-07").add_income("Salary Jul", 3100).add_dining("Restaurant", 45).build()
-        combined = combine_csvs(csv_june, csv_july)
+        combined = CSV_2025_06_07_COMBINED
 
         response = client.post(
             "/api/categorize",
@@ -254,97 +305,51 @@ class TestMultiMonthProcessing:
         data = response.json()
         assert len(data["months_processed"]) == 2
 
-        db_session.expire_all()
-        months = db_session.query(Month).all()
+        months = db_session.scalars(select(Month)).all()
         assert len(months) == 2
 
-        june = db_session.query(Month).filter_by(year=2025, month=6).first()
-        july = db_session.query(Month).filter_by(year=2025, month=7).first()
+        june = db_session.execute(_MONTH_BY_YEAR_MONTH, {"year": 2025, "month": 6}).scalar_one_or_none()
+        july = db_session.execute(_MONTH_BY_YEAR_MONTH, {"year": 2025, "month": 7}).scalar_one_or_none()
         assert june is not None
         assert july is not None
 
 
 @patch.dict(os.environ, MOCK_API_KEY_ENV)
-class TestPartialFailure:
-    """Integration tests for partial success scenarios."""
-
-    @patch("app.services.upload.service.TransactionCategorizer")
-    def test_api_error_mid_processing(
-        self, mock_categorizer_class: MagicMock, client: TestClient, db_session: Session
+class TestCategorizationFailure:
+    """Integration tests for categorization errors surfacing as 502."""
+
+    @pytest.mark.parametrize(
+        ("csv", "months_to_process", "successful_calls", "message"),
+        [
+            # ##>: The month record may still be created (replace mode creates it before categorization).
+            pytest.param(CSV_2025_10_INCOME, "2025-10", 0, "API connection failed", id="first_month"),
+            # ##>: First month succeeds, second month fails.
+            pytest.param(CSV_2025_06_07_COMBINED, "all", 1, "Claude API unavailable", id="mid_processing"),
+        ],
+    )
+    def test_categorization_error_returns_502(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        client: TestClient,
+        csv: bytes,
+        months_to_process: str,
+        successful_calls: int,
+        message: str,
     ) -> None:
         """
-        Partial success: API error on second month while first succeeds.
+        Claude API failure during categorization fails the request with 502.
 
-        Simulates Claude API failing mid-processing. The request should fail
-        with 502 when the second month's categorization fails.
+        The CategorizationError message is propagated in the response detail,
+        whether the failure hits the first month or a later one.
         """
-        mock_categorizer = MagicMock()
-        mock_categorizer_class.return_value = mock_categorizer
-        call_count = [0]
-
-        def categorize_side_effect(inputs: list[Any]) -> tuple[list[CategorizationResult], int]:
-            call_count[0] += 1
-            if call_count[0] == 1:
-                # ##>: First month succeeds. Return tuple matching new signature.
-                results = [
-                    CategorizationResult(
-                        id=i + 1,
-                        money_map_type=MoneyMapType.INCOME,
-                        money_map_subcategory="",
-                        confidence=0.95,
-                    )
-                    for i in range(len(inputs))
-                ]
-                return results, 1
-            else:
-                # ##>: Second month fails.
-                raise CategorizationError("Claude API unavailable")
-
-        mock_categorizer.categorize.side_effect = categorize_side_effect
-
-        # ##>: Build CSV with two months.
-        csv_aug = CSVBuilder("2025-08").add_income("Salary Aug", 3000).build()
-        csv_sep = CSVBuilder("2025-09").add_income("Salary Sep", 3100).build()
-        combined = combine_csvs(csv_aug, csv_sep)
-
-        response = client.post(
-            "/api/categorize",
-            files={"file": ("multi.csv", combined, "text/csv")},
-            params={"months_to_process": "all", "import_mode": "replace"},
-        )
-
-        # ##>: Request fails because second month errored. Error message is now propagated.
-        assert response.status_code == 502
-        assert "Claude API unavailable" in response.json()["detail"]
-
-
-@patch.dict(os.environ, MOCK_API_KEY_ENV)
-class TestErrorHandling:
-    """Integration tests for error handling scenarios."""
-
-    @patch("app.services.upload.service.TransactionCategorizer")
-    def test_claude_api_failure_returns_502(
-        self, mock_categorizer_class: MagicMock, client: TestClient, db_session: Session
-    ) -> None:
-        """
-        Claude API mock failure handling.
-
-        When the categorization service fails, the endpoint should return 502.
-        Note: The month record may still be created due to the replace mode flow
-        (month is created before categorization), but no transactions are added.
-        """
-        mock_categorizer = MagicMock()
-        mock_categorizer_class.return_value = mock_categorizer
-        mock_categorizer.categorize.side_effect = CategorizationError("API connection failed")
-
-        csv = CSVBuilder("2025-10").add_income("Salary", 3000).build()
+        categorizer = FailingCategorizer(successful_calls, message)
+        monkeypatch.setattr("app.services.upload.service.TransactionCategorizer", lambda **_kwargs: categorizer)
 
         response = client.post(
             "/api/categorize",
             files={"file": ("test.csv", csv, "text/csv")},
-            params={"months_to_process": "2025-10", "import_mode": "replace"},
+            params={"months_to_process": months_to_process, "import_mode": "replace"},
         )
 
         assert response.status_code == 502
-        # ##>: Generic CategorizationError now returns the actual error message.
-        assert "API connection failed" in response.json()["detail"]
+        assert message in response.json()["detail"]
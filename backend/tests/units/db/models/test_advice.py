@@ -10,29 +10,28 @@ from tests.conftest import DatabaseTestCase
 class TestAdviceModel(DatabaseTestCase):
     """Tests for Advice model creation and constraints."""
 
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        super().setUp()
+        self.month = Month(year=2025, month=10)
+        self.session.add(self.month)
+        self.session.flush()
+
     def test_create_advice_linked_to_month(self) -> None:
         """Should create an Advice record linked to a Month."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         advice = Advice(
-            month_id=month.id,
+            month_id=self.month.id,
             advice_text="Consider reducing dining out expenses to improve your score.",
         )
         self.session.add(advice)
         self.session.commit()
 
         self.assertIsNotNone(advice.id)
-        self.assertEqual(advice.month_id, month.id)
+        self.assertEqual(advice.month_id, self.month.id)
 
     def test_advice_text_is_required(self) -> None:
         """advice_text should not be nullable."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
-        advice = Advice(month_id=month.id, advice_text=None)
+        advice = Advice(month_id=self.month.id, advice_text=None)
         self.session.add(advice)
 
         with self.assertRaises(IntegrityError):
@@ -40,12 +39,8 @@ class TestAdviceModel(DatabaseTestCase):
 
     def test_generated_at_auto_sets_on_creation(self) -> None:
         """generated_at should be automatically set on creation."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         advice = Advice(
-            month_id=month.id,
+            month_id=self.month.id,
             advice_text="Your spending habits are excellent!",
         )
         self.session.add(advice)
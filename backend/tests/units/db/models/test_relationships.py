@@ -2,6 +2,9 @@
 
 from datetime import date
 
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
 from app.db.models.advice import Advice
 from app.db.models.month import Month
 from app.db.models.transaction import Transaction
@@ -11,84 +14,87 @@ from tests.conftest import DatabaseTestCase
 class TestModelRelationships(DatabaseTestCase):
     """Tests for foreign key relationships and cascade behavior."""
 
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        super().setUp()
+        self.month = Month(year=2025, month=10)
+        self.session.add(self.month)
+        self.session.flush()
+
     def test_month_transactions_returns_list(self) -> None:
         """Month.transactions should return a list of transactions."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         tx1 = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Transaction 1",
             amount=-50.0,
         )
         tx2 = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 16),
             description="Transaction 2",
             amount=-30.0,
         )
         self.session.add_all([tx1, tx2])
+        # ##>: Committing expires the month, so the collection below is loaded fresh without a refresh.
         self.session.commit()
+        self.assertEqual(self.month.year, 2025)
 
-        self.session.refresh(month)
-        self.assertEqual(len(month.transactions), 2)
-        self.assertIn(tx1, month.transactions)
-        self.assertIn(tx2, month.transactions)
+        # ##>: With the parent row reloaded, the collection must come back in a single SELECT.
+        with self.count_queries() as queries:
+            self.assertEqual(len(self.month.transactions), 2)
+            self.assertIn(tx1, self.month.transactions)
+            self.assertIn(tx2, self.month.transactions)
+        self.assertEqual(len(queries), 1)
 
     def test_month_advice_records_returns_list(self) -> None:
         """Month.advice_records should return a list of advice records."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
-        advice = Advice(month_id=month.id, advice_text="Great job!")
+        advice = Advice(month_id=self.month.id, advice_text="Great job!")
         self.session.add(advice)
         self.session.commit()
 
-        self.session.refresh(month)
-        self.assertEqual(len(month.advice_records), 1)
-        self.assertIn(advice, month.advice_records)
+        self.assertEqual(len(self.month.advice_records), 1)
+        self.assertIn(advice, self.month.advice_records)
 
     def test_transaction_month_back_reference(self) -> None:
         """Transaction.month should reference the parent Month."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         transaction = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Test transaction",
             amount=-50.0,
         )
         self.session.add(transaction)
-        self.session.commit()
+        self.session.flush()
 
-        self.assertIs(transaction.month, month)
-        self.assertEqual(transaction.month.year, 2025)
-        self.assertEqual(transaction.month.month, 10)
+        # ##>: The parent is already in the identity map, so the back reference must not emit any SQL.
+        with self.count_queries() as queries:
+            self.assertIs(transaction.month, self.month)
+            self.assertEqual(transaction.month.year, 2025)
+            self.assertEqual(transaction.month.month, 10)
+        self.assertEqual(queries, [])
 
     def test_cascade_delete_removes_transactions(self) -> None:
         """Deleting a Month should cascade delete its transactions."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         tx = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Test transaction",
             amount=-50.0,
         )
-        advice = Advice(month_id=month.id, advice_text="Great job!")
+        advice = Advice(month_id=self.month.id, advice_text="Great job!")
         self.session.add_all([tx, advice])
         self.session.commit()
 
         tx_id = tx.id
         advice_id = advice.id
 
+        # ##>: Load both child collections up front so the Python-side cascade does not lazy-load them one by one.
+        month = self.session.scalars(
+            select(Month)
+            .options(selectinload(Month.transactions), selectinload(Month.advice_records))
+            .where(Month.id == self.month.id)
+        ).one()
         self.session.delete(month)
         self.session.commit()
 
@@ -2,6 +2,7 @@
 
 from datetime import date
 
+from sqlalchemy import select, text
 from sqlalchemy.exc import IntegrityError
 
 from app.db.models.month import Month
@@ -12,14 +13,17 @@ from tests.conftest import DatabaseTestCase
 class TestTransactionModel(DatabaseTestCase):
     """Tests for Transaction model creation and constraints."""
 
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        super().setUp()
+        self.month = Month(year=2025, month=10)
+        self.session.add(self.month)
+        self.session.flush()
+
     def test_create_transaction_linked_to_month(self) -> None:
         """Should create a Transaction linked to a Month."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         transaction = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Test transaction",
             amount=-50.0,
@@ -28,16 +32,12 @@ class TestTransactionModel(DatabaseTestCase):
         self.session.commit()
 
         self.assertIsNotNone(transaction.id)
-        self.assertEqual(transaction.month_id, month.id)
+        self.assertEqual(transaction.month_id, self.month.id)
 
     def test_check_constraint_rejects_invalid_money_map_type(self) -> None:
         """Invalid money_map_type value should raise IntegrityError."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         transaction = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Test transaction",
             amount=-50.0,
@@ -50,12 +50,8 @@ class TestTransactionModel(DatabaseTestCase):
 
     def test_foreign_key_relationship_works(self) -> None:
         """Transaction should reference its parent Month correctly."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         transaction = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Test transaction",
             amount=-50.0,
@@ -64,17 +60,13 @@ class TestTransactionModel(DatabaseTestCase):
         self.session.add(transaction)
         self.session.commit()
 
-        self.assertEqual(transaction.month.id, month.id)
+        self.assertEqual(transaction.month.id, self.month.id)
         self.assertEqual(transaction.month.year, 2025)
 
     def test_is_manually_corrected_defaults_to_false(self) -> None:
         """is_manually_corrected should default to False."""
-        month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
         transaction = Transaction(
-            month_id=month.id,
+            month_id=self.month.id,
             date=date(2025, 10, 15),
             description="Test transaction",
             amount=-50.0,
@@ -83,3 +75,40 @@ class TestTransactionModel(DatabaseTestCase):
         self.session.commit()
 
         self.assertFalse(transaction.is_manually_corrected)
+
+
+class TestTransactionIndexes(DatabaseTestCase):
+    """Tests for Transaction indexes used by the month detail query path."""
+
+    def test_filtered_month_query_uses_composite_index(self) -> None:
+        """Month + type + date range query ordered by date should be served by the composite index."""
+        stmt = (
+            select(Transaction)
+            .where(
+                Transaction.month_id == 1,
+                Transaction.money_map_type.in_(["CORE"]),
+                Transaction.date >= date(2025, 10, 5),
+                Transaction.date <= date(2025, 10, 25),
+            )
+            .order_by(Transaction.date.asc())
+        )
+        compiled = stmt.compile(self.engine, compile_kwargs={"literal_binds": True})
+
+        plan = " ".join(row[3] for row in self.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+        self.assertIn("idx_transactions_month_date_type", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_search_query_is_narrowed_by_month_index(self) -> None:
+        """A leading-wildcard description search should only scan the month's rows via the composite index."""
+        stmt = (
+            select(Transaction)
+            .where(Transaction.month_id == 1, Transaction.description.ilike("%grocery%", escape="\\"))
+            .order_by(Transaction.date.asc())
+        )
+        compiled = stmt.compile(self.engine, compile_kwargs={"literal_binds": True})
+
+        plan = " ".join(row[3] for row in self.session.execute(text(f"EXPLAIN QUERY PLAN {compiled}")))
+
+        self.assertIn("SEARCH transactions USING INDEX idx_transactions_month_date_type", plan)
+        self.assertNotIn("SCAN transactions", plan)
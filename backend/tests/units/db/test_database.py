@@ -1,13 +1,14 @@
 """Tests for database configuration."""
 
-import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
-from sqlalchemy import text
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
 
-from app.db.database import DATABASE_PATH, engine, init_db
+from app.db.database import DATABASE_PATH, engine, init_db, sync_transaction_indexes
+from app.db.models.transaction import Transaction
 
 
 class TestDatabaseConfiguration(unittest.TestCase):
@@ -20,37 +21,76 @@ class TestDatabaseConfiguration(unittest.TestCase):
 
     def test_engine_can_connect_to_sqlite(self) -> None:
         """Engine should be able to establish a connection to SQLite."""
-        # ##>: Create the data directory if it does not exist so the test can connect.
-        DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        self.assertEqual(engine.dialect.name, "sqlite")
 
-        with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
-            self.assertEqual(result.scalar(), 1)
+        # ##>: Ping the same URL pointed at memory so the test never creates the on-disk database file.
+        probe = create_engine(engine.url.set(database=":memory:"), connect_args={"check_same_thread": False})
+        with probe.connect() as conn:
+            dbapi_connection = conn.connection.dbapi_connection
+            assert dbapi_connection is not None
+            self.assertTrue(conn.dialect.do_ping(dbapi_connection))
+        probe.dispose()
 
-    @patch("app.db.database.Base.metadata.create_all")
-    @patch("app.db.database.DATABASE_PATH")
-    def test_init_db_creates_data_directory(self, mock_db_path: MagicMock, _mock_create_all: MagicMock) -> None:
-        """init_db should create the data directory if it does not exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_db_path = Path(tmpdir) / "data" / "test.db"
-            mock_db_path.parent = test_db_path.parent
 
-            init_db()
+@pytest.fixture
+def tmp_db_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """
+    Point init_db at a database path under pytest's temporary directory.
+
+    Table creation and index sync are stubbed out so only the directory handling runs.
+
+    Returns
+    -------
+    Path
+        Database path whose ``data`` parent directory does not exist yet.
+    """
+    db_path = tmp_path / "data" / "test.db"
+    monkeypatch.setattr("app.db.database.DATABASE_PATH", db_path)
+    monkeypatch.setattr("app.db.database.Base.metadata.create_all", lambda *args, **kwargs: None)
+    monkeypatch.setattr("app.db.database.sync_transaction_indexes", lambda bind: None)
+    return db_path
+
+
+class TestInitDb:
+    """Tests for init_db data directory handling."""
+
+    def test_init_db_creates_data_directory(self, tmp_db_path: Path) -> None:
+        """init_db should create the data directory if it does not exist."""
+        init_db()
 
-            self.assertTrue(test_db_path.parent.exists())
+        assert tmp_db_path.parent.exists()
 
-    @patch("app.db.database.Base.metadata.create_all")
-    @patch("app.db.database.DATABASE_PATH")
-    def test_init_db_is_idempotent(self, mock_db_path: MagicMock, _mock_create_all: MagicMock) -> None:
+    def test_init_db_is_idempotent(self, tmp_db_path: Path) -> None:
         """init_db should be safe to call multiple times without error."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_db_path = Path(tmpdir) / "data" / "test.db"
-            mock_db_path.parent = test_db_path.parent
+        init_db()
+        init_db()
+
+        assert tmp_db_path.parent.exists()
+
+
+class TestSyncTransactionIndexes:
+    """Tests for upgrading transaction indexes on databases created before an index change."""
+
+    def test_replaces_legacy_month_index_with_model_indexes(self) -> None:
+        """An existing table with the old month index ends up with exactly the model's indexes."""
+        table = Transaction.metadata.tables["transactions"]
+        legacy = create_engine("sqlite://", poolclass=StaticPool)
+        with legacy.begin() as connection:
+            # ##>: Recreate the table as older releases did, carrying only the legacy indexes.
+            table.create(connection)
+            for index in table.indexes:
+                connection.execute(text(f"DROP INDEX {index.name}"))
+            connection.execute(text("CREATE INDEX idx_transactions_month ON transactions(month_id)"))
+            connection.execute(text("CREATE INDEX idx_transactions_date ON transactions(date)"))
+
+        sync_transaction_indexes(legacy)
+        # ##>: A second run must be a no-op, as init_db calls it on every start.
+        sync_transaction_indexes(legacy)
 
-            init_db()
-            init_db()
+        names = {index["name"] for index in inspect(legacy).get_indexes("transactions")}
+        legacy.dispose()
 
-            self.assertTrue(test_db_path.parent.exists())
+        assert names == {index.name for index in table.indexes}
 
 
 if __name__ == "__main__":
@@ -9,14 +9,6 @@ from app.db.enums import MoneyMapType, ScoreLabel
 class TestMoneyMapType(unittest.TestCase):
     """Tests for the MoneyMapType enum."""
 
-    def test_values_are_correct_strings(self) -> None:
-        """MoneyMapType should have the expected string values."""
-        self.assertEqual(MoneyMapType.INCOME.value, "INCOME")
-        self.assertEqual(MoneyMapType.CORE.value, "CORE")
-        self.assertEqual(MoneyMapType.CHOICE.value, "CHOICE")
-        self.assertEqual(MoneyMapType.COMPOUND.value, "COMPOUND")
-        self.assertEqual(MoneyMapType.EXCLUDED.value, "EXCLUDED")
-
     def test_inherits_from_str_and_enum(self) -> None:
         """MoneyMapType should inherit from str and Enum for SQLite compatibility."""
         self.assertTrue(issubclass(MoneyMapType, str))
@@ -25,17 +17,17 @@ class TestMoneyMapType(unittest.TestCase):
         # ##>: String inheritance allows direct string comparison without .value.
         self.assertEqual(MoneyMapType.INCOME, "INCOME")
 
+    def test_values_are_correct_strings(self) -> None:
+        """MoneyMapType should define exactly the expected members and string values."""
+        self.assertEqual(
+            {member.name: member.value for member in MoneyMapType},
+            {"INCOME": "INCOME", "CORE": "CORE", "CHOICE": "CHOICE", "COMPOUND": "COMPOUND", "EXCLUDED": "EXCLUDED"},
+        )
+
 
 class TestScoreLabel(unittest.TestCase):
     """Tests for the ScoreLabel enum."""
 
-    def test_values_match_expected_labels(self) -> None:
-        """ScoreLabel should have human-readable string values."""
-        self.assertEqual(ScoreLabel.POOR.value, "Poor")
-        self.assertEqual(ScoreLabel.NEED_IMPROVEMENT.value, "Need Improvement")
-        self.assertEqual(ScoreLabel.OKAY.value, "Okay")
-        self.assertEqual(ScoreLabel.GREAT.value, "Great")
-
     def test_inherits_from_str_and_enum(self) -> None:
         """ScoreLabel should inherit from str and Enum for SQLite compatibility."""
         self.assertTrue(issubclass(ScoreLabel, str))
@@ -44,6 +36,13 @@ class TestScoreLabel(unittest.TestCase):
         # ##>: String inheritance allows direct string comparison without .value.
         self.assertEqual(ScoreLabel.GREAT, "Great")
 
+    def test_values_are_correct_strings(self) -> None:
+        """ScoreLabel should define exactly the expected members and string values."""
+        self.assertEqual(
+            {member.name: member.value for member in ScoreLabel},
+            {"POOR": "Poor", "NEED_IMPROVEMENT": "Need Improvement", "OKAY": "Okay", "GREAT": "Great"},
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,50 @@
+"""Month fixtures for repository unit tests."""
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.db.models.month import Month
+
+
+@pytest.fixture
+def month(db_session: Session) -> Month:
+    """
+    Persisted January 2025 month for tests that attach child records.
+
+    The month is flushed so its ID is available without committing.
+
+    Parameters
+    ----------
+    db_session : Session
+        SQLAlchemy session from db_session fixture.
+
+    Returns
+    -------
+    Month
+        Flushed Month record.
+    """
+    month = Month(year=2025, month=1)
+    db_session.add(month)
+    db_session.flush()
+    return month
+
+
+@pytest.fixture
+def two_months(db_session: Session) -> tuple[Month, Month]:
+    """
+    Persisted January and February 2025 months for cross-month aggregations.
+
+    Parameters
+    ----------
+    db_session : Session
+        SQLAlchemy session from db_session fixture.
+
+    Returns
+    -------
+    tuple[Month, Month]
+        Flushed January and February Month records.
+    """
+    months = (Month(year=2025, month=1), Month(year=2025, month=2))
+    db_session.add_all(months)
+    db_session.flush()
+    return months
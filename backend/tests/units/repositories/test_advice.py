@@ -1,123 +1,106 @@
 """Unit tests for AdviceRepository."""
 
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
 from app.db.models.advice import Advice
 from app.db.models.month import Month
 from app.repositories.advice import AdviceRepository
-from tests.conftest import DatabaseTestCase
 
 
-class TestAdviceRepository(DatabaseTestCase):
+class TestAdviceRepository:
     """Test cases for AdviceRepository data access operations."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        super().setUp()
-        self.month = Month(year=2025, month=1)
-        self.session.add(self.month)
-        self.session.commit()
-
-    def test_get_by_month_id_returns_advice(self) -> None:
+    def test_get_by_month_id_returns_advice(self, db_session: Session, month: Month) -> None:
         """get_by_month_id returns advice when it exists."""
-        advice = Advice(month_id=self.month.id, advice_text='{"summary": "Test advice"}')
-        self.session.add(advice)
-        self.session.commit()
+        advice = Advice(month_id=month.id, advice_text='{"summary": "Test advice"}')
+        db_session.add(advice)
+        db_session.commit()
 
-        repo = AdviceRepository(self.session)
-        result = repo.get_by_month_id(self.month.id)
+        repo = AdviceRepository(db_session)
+        result = repo.get_by_month_id(month.id)
 
         assert result is not None
         assert result.advice_text == '{"summary": "Test advice"}'
 
-    def test_get_by_month_id_returns_none_for_missing(self) -> None:
+    def test_get_by_month_id_returns_none_for_missing(self, db_session: Session, month: Month) -> None:
         """get_by_month_id returns None when advice does not exist."""
-        repo = AdviceRepository(self.session)
-        result = repo.get_by_month_id(self.month.id)
+        repo = AdviceRepository(db_session)
+        result = repo.get_by_month_id(month.id)
 
         assert result is None
 
-    def test_upsert_creates_new_advice(self) -> None:
+    def test_upsert_creates_new_advice(self, db_session: Session, month: Month) -> None:
         """upsert creates new advice when none exists."""
-        repo = AdviceRepository(self.session)
-        result = repo.upsert(self.month.id, '{"summary": "New advice"}')
+        repo = AdviceRepository(db_session)
+        result = repo.upsert(month.id, '{"summary": "New advice"}')
 
         assert result.id is not None
         assert result.advice_text == '{"summary": "New advice"}'
-        assert result.month_id == self.month.id
+        assert result.month_id == month.id
 
-    def test_upsert_updates_existing_advice(self) -> None:
+    def test_upsert_updates_existing_advice(self, db_session: Session, month: Month) -> None:
         """upsert updates advice when it already exists."""
-        advice = Advice(month_id=self.month.id, advice_text='{"summary": "Old advice"}')
-        self.session.add(advice)
-        self.session.commit()
+        advice = Advice(month_id=month.id, advice_text='{"summary": "Old advice"}')
+        db_session.add(advice)
+        db_session.commit()
         original_id = advice.id
 
-        repo = AdviceRepository(self.session)
-        result = repo.upsert(self.month.id, '{"summary": "Updated advice"}')
+        repo = AdviceRepository(db_session)
+        result = repo.upsert(month.id, '{"summary": "Updated advice"}')
 
         assert result.id == original_id  # Same record
         assert result.advice_text == '{"summary": "Updated advice"}'
 
-    def test_upsert_updates_generated_at_timestamp(self) -> None:
+    def test_upsert_updates_generated_at_timestamp(self, db_session: Session, month: Month) -> None:
         """upsert updates generated_at timestamp when updating."""
-        advice = Advice(month_id=self.month.id, advice_text='{"summary": "Old advice"}')
-        self.session.add(advice)
-        self.session.commit()
-
-        # ##>: Refresh to get timezone-naive datetime from DB (SQLite doesn't preserve timezone).
-        self.session.refresh(advice)
-        original_timestamp = advice.generated_at
-
-        # Allow time difference
-        import time
-
-        time.sleep(0.01)
-
-        repo = AdviceRepository(self.session)
-        result = repo.upsert(self.month.id, '{"summary": "Updated advice"}')
+        # ##>: Start from a fixed past timestamp so the refresh is observable without waiting on the clock.
+        original_timestamp = datetime(2000, 1, 1)
+        advice = Advice(month_id=month.id, advice_text='{"summary": "Old advice"}', generated_at=original_timestamp)
+        db_session.add(advice)
+        db_session.commit()
 
-        # ##>: Compare timezone-naive datetimes (strip timezone from result for SQLite compatibility).
-        result_timestamp = (
-            result.generated_at.replace(tzinfo=None) if result.generated_at.tzinfo else result.generated_at
-        )
-        original_naive = original_timestamp.replace(tzinfo=None) if original_timestamp.tzinfo else original_timestamp
+        repo = AdviceRepository(db_session)
+        result = repo.upsert(month.id, '{"summary": "Updated advice"}')
 
-        assert result_timestamp > original_naive
+        # ##>: Compare timezone-naive datetimes (SQLite doesn't preserve timezone).
+        assert result.generated_at.replace(tzinfo=None) > original_timestamp
 
-    def test_delete_removes_advice(self) -> None:
+    def test_delete_removes_advice(self, db_session: Session, month: Month) -> None:
         """delete removes advice from database."""
-        advice = Advice(month_id=self.month.id, advice_text='{"summary": "To delete"}')
-        self.session.add(advice)
-        self.session.commit()
+        advice = Advice(month_id=month.id, advice_text='{"summary": "To delete"}')
+        db_session.add(advice)
+        db_session.commit()
 
-        repo = AdviceRepository(self.session)
+        repo = AdviceRepository(db_session)
         repo.delete(advice)
         repo.commit()
 
-        assert repo.get_by_month_id(self.month.id) is None
+        assert repo.get_by_month_id(month.id) is None
 
-    def test_commit_persists_changes(self) -> None:
+    def test_commit_persists_changes(self, db_session: Session, month: Month) -> None:
         """commit persists pending changes to database."""
-        repo = AdviceRepository(self.session)
-        advice = Advice(month_id=self.month.id, advice_text='{"summary": "Test"}')
-        self.session.add(advice)
+        repo = AdviceRepository(db_session)
+        advice = Advice(month_id=month.id, advice_text='{"summary": "Test"}')
+        db_session.add(advice)
 
         repo.commit()
 
         # Verify in new query
-        result = repo.get_by_month_id(self.month.id)
+        result = repo.get_by_month_id(month.id)
         assert result is not None
 
-    def test_rollback_reverts_changes(self) -> None:
+    def test_rollback_reverts_changes(self, db_session: Session, month: Month) -> None:
         """rollback reverts uncommitted changes."""
-        advice = Advice(month_id=self.month.id, advice_text='{"summary": "Original"}')
-        self.session.add(advice)
-        self.session.commit()
+        advice = Advice(month_id=month.id, advice_text='{"summary": "Original"}')
+        db_session.add(advice)
+        db_session.commit()
 
-        repo = AdviceRepository(self.session)
+        repo = AdviceRepository(db_session)
         advice.advice_text = '{"summary": "Modified"}'
 
         repo.rollback()
 
-        # Refresh to get original value
-        self.session.refresh(advice)
+        # ##>: Rollback expires the instance, so the next read reloads the committed value.
         assert advice.advice_text == '{"summary": "Original"}'
@@ -1,56 +1,59 @@
 """Unit tests for AdviceRepository eligibility methods."""
 
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
 from app.db.models.advice import Advice
 from app.db.models.month import Month
 from app.repositories.advice import AdviceRepository
-from tests.conftest import DatabaseTestCase
 
 
-class TestAdviceRepositoryEligibility(DatabaseTestCase):
+class TestAdviceRepositoryEligibility:
     """Test cases for AdviceRepository eligibility-related methods."""
 
-    def test_has_any_returns_true_when_advice_exists(self) -> None:
+    def test_has_any_returns_true_when_advice_exists(self, db_session: Session) -> None:
         """has_any returns True when at least one advice record exists."""
         month = Month(year=2025, month=1)
-        self.session.add(month)
-        self.session.commit()
-
-        advice = Advice(month_id=month.id, advice_text='{"test": "data"}')
-        self.session.add(advice)
-        self.session.commit()
+        advice = Advice(month=month, advice_text='{"test": "data"}')
+        db_session.add_all([month, advice])
+        db_session.commit()
 
-        repo = AdviceRepository(self.session)
+        repo = AdviceRepository(db_session)
         result = repo.has_any()
 
         assert result is True
 
-    def test_has_any_returns_false_when_empty(self) -> None:
+    def test_has_any_returns_false_when_empty(self, db_session: Session) -> None:
         """has_any returns False when no advice records exist."""
-        repo = AdviceRepository(self.session)
+        repo = AdviceRepository(db_session)
         result = repo.has_any()
 
         assert result is False
 
-    def test_count_returns_correct_count(self) -> None:
+    def test_count_returns_correct_count(self, db_session: Session) -> None:
         """count returns the total number of advice records."""
-        month1 = Month(year=2025, month=1)
-        month2 = Month(year=2025, month=2)
-        month3 = Month(year=2025, month=3)
-        self.session.add_all([month1, month2, month3])
-        self.session.commit()
-
-        self.session.add(Advice(month_id=month1.id, advice_text='{"test": "1"}'))
-        self.session.add(Advice(month_id=month2.id, advice_text='{"test": "2"}'))
-        self.session.commit()
-
-        repo = AdviceRepository(self.session)
+        # ##>: Bulk inserts skip the unit of work; RETURNING hands back the month IDs in the same statement.
+        month_ids = db_session.scalars(
+            insert(Month).returning(Month.id, sort_by_parameter_order=True),
+            [{"year": 2025, "month": 1}, {"year": 2025, "month": 2}, {"year": 2025, "month": 3}],
+        ).all()
+        db_session.execute(
+            insert(Advice),
+            [
+                {"month_id": month_ids[0], "advice_text": '{"test": "1"}'},
+                {"month_id": month_ids[1], "advice_text": '{"test": "2"}'},
+            ],
+        )
+        db_session.commit()
+
+        repo = AdviceRepository(db_session)
         result = repo.count()
 
         assert result == 2
 
-    def test_count_returns_zero_when_empty(self) -> None:
+    def test_count_returns_zero_when_empty(self, db_session: Session) -> None:
         """count returns 0 when no advice records exist."""
-        repo = AdviceRepository(self.session)
+        repo = AdviceRepository(db_session)
         result = repo.count()
 
         assert result == 0
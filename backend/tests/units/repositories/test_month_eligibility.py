@@ -1,31 +1,38 @@
 """Unit tests for MonthRepository eligibility methods."""
 
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
 from app.db.models.month import Month
 from app.repositories.month import MonthRepository
-from tests.conftest import DatabaseTestCase
 
 
-class TestMonthRepositoryEligibility(DatabaseTestCase):
+class TestMonthRepositoryEligibility:
     """Test cases for MonthRepository eligibility-related methods."""
 
-    def test_get_most_recent_returns_latest_month(self) -> None:
+    def test_get_most_recent_returns_latest_month(self, db_session: Session) -> None:
         """get_most_recent returns the month with highest year/month."""
-        self.session.add(Month(year=2024, month=10))
-        self.session.add(Month(year=2024, month=12))
-        self.session.add(Month(year=2025, month=1))
-        self.session.add(Month(year=2024, month=11))
-        self.session.commit()
-
-        repo = MonthRepository(self.session)
+        db_session.execute(
+            insert(Month),
+            [
+                {"year": 2024, "month": 10},
+                {"year": 2024, "month": 12},
+                {"year": 2025, "month": 1},
+                {"year": 2024, "month": 11},
+            ],
+        )
+        db_session.commit()
+
+        repo = MonthRepository(db_session)
         result = repo.get_most_recent()
 
         assert result is not None
         assert result.year == 2025
         assert result.month == 1
 
-    def test_get_most_recent_returns_none_when_empty(self) -> None:
+    def test_get_most_recent_returns_none_when_empty(self, db_session: Session) -> None:
         """get_most_recent returns None when no months exist."""
-        repo = MonthRepository(self.session)
+        repo = MonthRepository(db_session)
         result = repo.get_most_recent()
 
         assert result is None
@@ -1,320 +1,297 @@
 """Unit tests for TransactionRepository."""
 
 from datetime import date
+from typing import Any
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from app.db.enums import MoneyMapType
 from app.db.models.month import Month
 from app.db.models.transaction import Transaction
 from app.repositories.transaction import TransactionRepository
-from tests.conftest import DatabaseTestCase
+from tests.conftest import count_queries
 
 
-class TestTransactionRepository(DatabaseTestCase):
-    """Test cases for TransactionRepository data access operations."""
+def _tx(month: Month, day: int, description: str, amount: float, **fields: Any) -> dict[str, Any]:
+    """Build a transaction row dated ``day`` of the given month; extra columns pass through ``fields``."""
+    return {
+        "month_id": month.id,
+        "date": date(month.year, month.month, day),
+        "description": description,
+        "amount": amount,
+        **fields,
+    }
+
+
+def _insert_transactions(session: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert transaction rows with one executemany statement, bypassing the ORM unit of work."""
+    session.execute(insert(Transaction), rows)
+
+
+@pytest.fixture
+def repo(db_session: Session) -> TransactionRepository:
+    """Transaction repository bound to the test session."""
+    return TransactionRepository(db_session)
+
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        super().setUp()
-        self.month = Month(year=2025, month=1)
-        self.session.add(self.month)
-        self.session.commit()
+class TestTransactionRepository:
+    """Test cases for TransactionRepository data access operations."""
 
-    def test_get_by_id_returns_transaction(self) -> None:
+    def test_get_by_id_returns_transaction(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
         """get_by_id returns transaction when it exists."""
-        tx = Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="Test", amount=100.0)
-        self.session.add(tx)
-        self.session.commit()
+        tx = Transaction(**_tx(month, 1, "Test", 100.0))
+        db_session.add(tx)
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
         result = repo.get_by_id(tx.id)
 
         assert result is not None
         assert result.description == "Test"
 
-    def test_get_by_id_returns_none_for_missing(self) -> None:
+    def test_get_by_id_returns_none_for_missing(self, repo: TransactionRepository) -> None:
         """get_by_id returns None when transaction does not exist."""
-        repo = TransactionRepository(self.session)
         result = repo.get_by_id(999)
 
         assert result is None
 
-    def test_get_filtered_returns_transactions_for_month(self) -> None:
-        """get_filtered returns all transactions for specified month."""
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="Tx1", amount=100.0))
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 2), description="Tx2", amount=200.0))
-        self.session.commit()
-
-        repo = TransactionRepository(self.session)
-        transactions, total = repo.get_filtered(self.month.id)
-
-        assert len(transactions) == 2
-        assert total == 2
-
-    def test_get_filtered_filters_by_category_types(self) -> None:
-        """get_filtered filters by money_map_type when provided."""
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 1),
-                description="Income",
-                amount=1000.0,
-                money_map_type=MoneyMapType.INCOME.value,
-            )
-        )
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 2),
-                description="Rent",
-                amount=-500.0,
-                money_map_type=MoneyMapType.CORE.value,
-            )
-        )
-        self.session.commit()
-
-        repo = TransactionRepository(self.session)
-        transactions, total = repo.get_filtered(self.month.id, category_types=[MoneyMapType.INCOME.value])
-
-        assert len(transactions) == 1
-        assert transactions[0].description == "Income"
-        assert total == 1
-
-    def test_get_filtered_filters_by_search(self) -> None:
-        """get_filtered filters by description search."""
-        self.session.add(
-            Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="Grocery store", amount=-50.0)
-        )
-        self.session.add(
-            Transaction(month_id=self.month.id, date=date(2025, 1, 2), description="Gas station", amount=-40.0)
-        )
-        self.session.commit()
-
-        repo = TransactionRepository(self.session)
-        transactions, total = repo.get_filtered(self.month.id, search="grocery")
-
-        assert len(transactions) == 1
-        assert "Grocery" in transactions[0].description
-        assert total == 1
-
-    def test_get_filtered_filters_by_date_range(self) -> None:
-        """get_filtered filters by date range."""
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="Early", amount=100.0))
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 15), description="Mid", amount=200.0))
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 31), description="Late", amount=300.0))
-        self.session.commit()
-
-        repo = TransactionRepository(self.session)
-        transactions, total = repo.get_filtered(
-            self.month.id, start_date=date(2025, 1, 10), end_date=date(2025, 1, 20)
-        )
-
-        assert len(transactions) == 1
-        assert transactions[0].description == "Mid"
-        assert total == 1
-
-    def test_get_filtered_paginates_correctly(self) -> None:
+    def test_get_filtered_paginates_correctly(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
         """get_filtered respects page and page_size."""
-        for i in range(10):
-            self.session.add(
-                Transaction(month_id=self.month.id, date=date(2025, 1, i + 1), description=f"Tx{i}", amount=100.0)
-            )
-        self.session.commit()
+        _insert_transactions(db_session, [_tx(month, i + 1, f"Tx{i}", 100.0) for i in range(10)])
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        transactions, total = repo.get_filtered(self.month.id, page=2, page_size=3)
+        month_id = month.id
+        with count_queries(db_session.connection()) as queries:
+            transactions, total = repo.get_filtered(month_id, page=2, page_size=3)
 
+        assert len(queries) == 2  # COUNT plus the page itself.
         assert len(transactions) == 3
         assert total == 10
 
-    def test_get_filtered_orders_by_date_asc(self) -> None:
-        """get_filtered orders transactions by date ascending."""
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="First", amount=100.0))
-        self.session.add(
-            Transaction(month_id=self.month.id, date=date(2025, 1, 15), description="Second", amount=200.0)
-        )
-        self.session.commit()
+    def test_get_filtered_month_access_is_not_n_plus_one(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
+        """Reading transaction.month on every returned row issues no query beyond the page itself."""
+        _insert_transactions(db_session, [_tx(month, i + 1, f"Tx{i}", 100.0) for i in range(20)])
+        db_session.commit()
+
+        month_id = month.id
+        with count_queries(db_session.connection()) as queries:
+            transactions, _ = repo.get_filtered(month_id, page_size=20)
+            years = {t.month.year for t in transactions}
+
+        # ##>: Every row shares one parent already in the identity map, so the many-to-one lazy load emits no SQL.
+        assert len(queries) == 2
+        assert years == {2025}
+
+    def test_get_all_for_month_returns_all_transactions(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
+        """get_all_for_month returns all transactions without pagination."""
+        _insert_transactions(db_session, [_tx(month, i + 1, f"Tx{i}", 100.0) for i in range(5)])
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        transactions, _ = repo.get_filtered(self.month.id)
+        result = repo.get_all_for_month(month.id)
 
-        assert transactions[0].description == "First"  # Oldest first
-        assert transactions[1].description == "Second"
+        assert len(result) == 5
 
-    def test_get_all_for_month_returns_all_transactions(self) -> None:
-        """get_all_for_month returns all transactions without pagination."""
-        for i in range(5):
-            self.session.add(
-                Transaction(month_id=self.month.id, date=date(2025, 1, i + 1), description=f"Tx{i}", amount=100.0)
-            )
-        self.session.commit()
+    def test_count_for_month_counts_only_month_transactions(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
+        """count_for_month counts transactions of the given month only."""
+        other_month = Month(year=2025, month=2)
+        db_session.add(other_month)
+        db_session.commit()
+        _insert_transactions(
+            db_session,
+            [
+                _tx(month, 1, "Tx1", 100.0),
+                _tx(month, 2, "Tx2", 200.0),
+                _tx(other_month, 1, "Tx3", 50.0),
+            ],
+        )
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        result = repo.get_all_for_month(self.month.id)
+        assert repo.count_for_month(month.id) == 2
+        assert repo.count_for_month(other_month.id) == 1
 
-        assert len(result) == 5
+    def test_count_for_month_returns_zero_for_empty_month(self, repo: TransactionRepository, month: Month) -> None:
+        """count_for_month returns 0 when month has no transactions."""
+        assert repo.count_for_month(month.id) == 0
 
-    def test_aggregate_totals_calculates_income_core_choice(self) -> None:
+    def test_aggregate_totals_calculates_income_core_choice(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
         """aggregate_totals returns correct income, core, choice totals."""
-        # Income (positive)
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 1),
-                description="Salary",
-                amount=5000.0,
-                money_map_type=MoneyMapType.INCOME.value,
-            )
+        _insert_transactions(
+            db_session,
+            [
+                # Income (positive)
+                _tx(month, 1, "Salary", 5000.0, money_map_type=MoneyMapType.INCOME.value),
+                # Core (negative)
+                _tx(month, 2, "Rent", -1500.0, money_map_type=MoneyMapType.CORE.value),
+                # Choice (negative)
+                _tx(month, 3, "Restaurant", -200.0, money_map_type=MoneyMapType.CHOICE.value),
+            ],
         )
-        # Core (negative)
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 2),
-                description="Rent",
-                amount=-1500.0,
-                money_map_type=MoneyMapType.CORE.value,
-            )
-        )
-        # Choice (negative)
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 3),
-                description="Restaurant",
-                amount=-200.0,
-                money_map_type=MoneyMapType.CHOICE.value,
-            )
-        )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        income, core, choice = repo.aggregate_totals(self.month.id)
+        month_id = month.id
+        with count_queries(db_session.connection()) as queries:
+            income, core, choice = repo.aggregate_totals(month_id)
 
+        assert len(queries) == 1  # All three totals come from one query with filtered SUMs.
         assert income == 5000.0
         assert core == 1500.0  # Absolute value
         assert choice == 200.0  # Absolute value
 
-    def test_aggregate_totals_returns_zeros_for_empty_month(self) -> None:
+    def test_aggregate_totals_returns_zeros_for_empty_month(self, repo: TransactionRepository, month: Month) -> None:
         """aggregate_totals returns zeros when month has no transactions."""
-        repo = TransactionRepository(self.session)
-        income, core, choice = repo.aggregate_totals(self.month.id)
+        income, core, choice = repo.aggregate_totals(month.id)
 
         assert income == 0.0
         assert core == 0.0
         assert choice == 0.0
 
-    def test_add_bulk_adds_multiple_transactions(self) -> None:
-        """add_bulk adds multiple transactions at once."""
-        transactions = [
-            Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="Tx1", amount=100.0),
-            Transaction(month_id=self.month.id, date=date(2025, 1, 2), description="Tx2", amount=200.0),
-            Transaction(month_id=self.month.id, date=date(2025, 1, 3), description="Tx3", amount=300.0),
-        ]
+    def test_add_bulk_mappings_inserts_rows_in_one_statement(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
+        """add_bulk_mappings inserts every row with a single executemany INSERT."""
+        rows = [_tx(month, 1, "Tx1", 100.0), _tx(month, 2, "Tx2", 200.0), _tx(month, 3, "Tx3", 300.0)]
+
+        with count_queries(db_session.connection()) as queries:
+            repo.add_bulk_mappings(rows)
+
+        assert len(queries) == 1
+        assert [tx.description for tx in repo.get_all_for_month(month.id)] == ["Tx1", "Tx2", "Tx3"]
 
-        repo = TransactionRepository(self.session)
-        repo.add_bulk(transactions)
-        repo.flush()
-        self.session.commit()
+    def test_add_bulk_mappings_ignores_empty_list(self, db_session: Session, repo: TransactionRepository) -> None:
+        """add_bulk_mappings issues no SQL for an empty list."""
+        with count_queries(db_session.connection()) as queries:
+            repo.add_bulk_mappings([])
 
-        all_tx = repo.get_all_for_month(self.month.id)
-        assert len(all_tx) == 3
+        assert queries == []
 
-    def test_delete_for_month_removes_all_transactions(self) -> None:
+    def test_delete_for_month_removes_all_transactions(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
         """delete_for_month removes all transactions for specified month."""
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 1), description="Tx1", amount=100.0))
-        self.session.add(Transaction(month_id=self.month.id, date=date(2025, 1, 2), description="Tx2", amount=200.0))
-        self.session.commit()
+        _insert_transactions(
+            db_session,
+            [
+                _tx(month, 1, "Tx1", 100.0),
+                _tx(month, 2, "Tx2", 200.0),
+            ],
+        )
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        count = repo.delete_for_month(self.month.id)
-        self.session.commit()
+        count = repo.delete_for_month(month.id)
+        db_session.commit()
 
         assert count == 2
-        assert len(repo.get_all_for_month(self.month.id)) == 0
+        assert repo.count_for_month(month.id) == 0
 
-    def test_get_keys_for_month_returns_unique_keys(self) -> None:
+    def test_get_keys_for_month_returns_unique_keys(
+        self, db_session: Session, repo: TransactionRepository, month: Month
+    ) -> None:
         """get_keys_for_month returns transaction keys for deduplication."""
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 1),
-                description="Tx1",
-                amount=100.0,
-                account="Account1",
-            )
-        )
-        self.session.add(
-            Transaction(
-                month_id=self.month.id,
-                date=date(2025, 1, 2),
-                description="Tx2",
-                amount=200.0,
-                account="Account2",
-            )
+        _insert_transactions(
+            db_session,
+            [
+                _tx(month, 1, "Tx1", 100.0, account="Account1"),
+                _tx(month, 2, "Tx2", 200.0, account="Account2"),
+            ],
         )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        keys = repo.get_keys_for_month(self.month.id)
+        keys = repo.get_keys_for_month(month.id)
 
-        assert len(keys) == 2
-        assert "2025-01-01_Tx1_100.0_Account1" in keys
-        assert "2025-01-02_Tx2_200.0_Account2" in keys
+        assert keys == {"2025-01-01_Tx1_100.0_Account1", "2025-01-02_Tx2_200.0_Account2"}
 
-    def test_escape_like_pattern_escapes_wildcards(self) -> None:
-        """_escape_like_pattern escapes SQL LIKE wildcards."""
-        assert TransactionRepository._escape_like_pattern("test%value") == "test\\%value"
-        assert TransactionRepository._escape_like_pattern("test_value") == "test\\_value"
-        assert TransactionRepository._escape_like_pattern("test\\value") == "test\\\\value"
 
+# ##>: (day, description, amount, money_map_type) rows for every get_filtered case, seeded out of date order.
+_FILTERED_ROWS: list[tuple[int, str, float, str]] = [
+    (31, "Restaurant", -200.0, MoneyMapType.CHOICE.value),
+    (1, "Salary", 1000.0, MoneyMapType.INCOME.value),
+    (15, "Gas station", -40.0, MoneyMapType.CORE.value),
+    (2, "Grocery store", -50.0, MoneyMapType.CORE.value),
+]
 
-class TestAggregateBySubcategory(DatabaseTestCase):
-    """Test cases for aggregate_by_subcategory repository method."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures with multiple months."""
-        super().setUp()
-        self.month1 = Month(year=2025, month=1)
-        self.month2 = Month(year=2025, month=2)
-        self.session.add_all([self.month1, self.month2])
-        self.session.commit()
+class TestGetFiltered:
+    """Test cases for TransactionRepository.get_filtered filters and ordering."""
 
-    def test_returns_grouped_data_by_type_and_subcategory(self) -> None:
-        """aggregate_by_subcategory returns data grouped by type and subcategory."""
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 1),
-                description="Rent",
-                amount=-1200.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Housing",
-            )
-        )
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 5),
-                description="Carrefour",
-                amount=-150.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Groceries",
-            )
+    @pytest.fixture
+    def seeded_month_id(self, db_session: Session, month: Month) -> int:
+        """Seed the shared rows into the month and return its ID."""
+        _insert_transactions(
+            db_session,
+            [_tx(month, day, desc, amount, money_map_type=kind) for day, desc, amount, kind in _FILTERED_ROWS],
         )
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 10),
-                description="Restaurant",
-                amount=-50.0,
-                money_map_type=MoneyMapType.CHOICE.value,
-                money_map_subcategory="Dining out",
-            )
+        db_session.commit()
+        return month.id
+
+    @pytest.mark.parametrize(
+        ("filters", "expected"),
+        [
+            pytest.param({}, ["Salary", "Grocery store", "Gas station", "Restaurant"], id="all_ordered_by_date"),
+            pytest.param({"category_types": [MoneyMapType.INCOME.value]}, ["Salary"], id="category_types"),
+            pytest.param({"search": "grocery"}, ["Grocery store"], id="search_case_insensitive"),
+            pytest.param(
+                {"start_date": date(2025, 1, 10), "end_date": date(2025, 1, 20)}, ["Gas station"], id="date_range"
+            ),
+        ],
+    )
+    def test_get_filtered(
+        self, repo: TransactionRepository, seeded_month_id: int, filters: dict[str, Any], expected: list[str]
+    ) -> None:
+        """get_filtered returns the matching transactions, oldest first, with their total count."""
+        transactions, total = repo.get_filtered(seeded_month_id, **filters)
+
+        assert [tx.description for tx in transactions] == expected
+        assert total == len(expected)
+
+
+class TestAggregateBySubcategory:
+    """Test cases for aggregate_by_subcategory repository method."""
+
+    def test_returns_grouped_data_by_type_and_subcategory(
+        self, db_session: Session, repo: TransactionRepository, two_months: tuple[Month, Month]
+    ) -> None:
+        """aggregate_by_subcategory returns data grouped by type and subcategory."""
+        month1, _ = two_months
+        _insert_transactions(
+            db_session,
+            [
+                _tx(
+                    month1, 1, "Rent", -1200.0, money_map_type=MoneyMapType.CORE.value, money_map_subcategory="Housing"
+                ),
+                _tx(
+                    month1,
+                    5,
+                    "Carrefour",
+                    -150.0,
+                    money_map_type=MoneyMapType.CORE.value,
+                    money_map_subcategory="Groceries",
+                ),
+                _tx(
+                    month1,
+                    10,
+                    "Restaurant",
+                    -50.0,
+                    money_map_type=MoneyMapType.CHOICE.value,
+                    money_map_subcategory="Dining out",
+                ),
+            ],
         )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        result = repo.aggregate_by_subcategory([self.month1.id])
+        result = repo.aggregate_by_subcategory([month1.id])
 
         assert len(result) == 3
         result_dict = {(r[0], r[1]): r[2] for r in result}
@@ -322,109 +299,114 @@ class TestAggregateBySubcategory(DatabaseTestCase):
         assert result_dict[(MoneyMapType.CORE.value, "Groceries")] == 150.0
         assert result_dict[(MoneyMapType.CHOICE.value, "Dining out")] == 50.0
 
-    def test_returns_empty_list_for_empty_month_ids(self) -> None:
+    def test_returns_empty_list_for_empty_month_ids(self, repo: TransactionRepository) -> None:
         """aggregate_by_subcategory returns empty list when month_ids is empty."""
-        repo = TransactionRepository(self.session)
         result = repo.aggregate_by_subcategory([])
 
         assert result == []
 
-    def test_excludes_excluded_transactions(self) -> None:
+    def test_excludes_excluded_transactions(
+        self, db_session: Session, repo: TransactionRepository, two_months: tuple[Month, Month]
+    ) -> None:
         """aggregate_by_subcategory filters out EXCLUDED transactions."""
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 1),
-                description="Internal transfer",
-                amount=-500.0,
-                money_map_type=MoneyMapType.EXCLUDED.value,
-                money_map_subcategory="Transfer",
-            )
-        )
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 5),
-                description="Rent",
-                amount=-1000.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Housing",
-            )
+        month1, _ = two_months
+        _insert_transactions(
+            db_session,
+            [
+                _tx(
+                    month1,
+                    1,
+                    "Internal transfer",
+                    -500.0,
+                    money_map_type=MoneyMapType.EXCLUDED.value,
+                    money_map_subcategory="Transfer",
+                ),
+                _tx(
+                    month1, 5, "Rent", -1000.0, money_map_type=MoneyMapType.CORE.value, money_map_subcategory="Housing"
+                ),
+            ],
         )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        result = repo.aggregate_by_subcategory([self.month1.id])
+        result = repo.aggregate_by_subcategory([month1.id])
 
         assert len(result) == 1
         assert result[0][0] == MoneyMapType.CORE.value
 
-    def test_returns_absolute_values_for_expenses(self) -> None:
+    def test_returns_absolute_values_for_expenses(
+        self, db_session: Session, repo: TransactionRepository, two_months: tuple[Month, Month]
+    ) -> None:
         """aggregate_by_subcategory returns absolute values for negative amounts."""
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 1),
-                description="Rent",
-                amount=-1500.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Housing",
-            )
+        month1, _ = two_months
+        _insert_transactions(
+            db_session,
+            [_tx(month1, 1, "Rent", -1500.0, money_map_type=MoneyMapType.CORE.value, money_map_subcategory="Housing")],
         )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        result = repo.aggregate_by_subcategory([self.month1.id])
+        result = repo.aggregate_by_subcategory([month1.id])
 
         assert result[0][2] == 1500.0
 
-    def test_aggregates_across_multiple_months(self) -> None:
+    def test_aggregates_across_multiple_months(
+        self, db_session: Session, repo: TransactionRepository, two_months: tuple[Month, Month]
+    ) -> None:
         """aggregate_by_subcategory sums across multiple months."""
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 1),
-                description="Rent Jan",
-                amount=-1200.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Housing",
-            )
+        month1, month2 = two_months
+        _insert_transactions(
+            db_session,
+            [
+                _tx(
+                    month1,
+                    1,
+                    "Rent Jan",
+                    -1200.0,
+                    money_map_type=MoneyMapType.CORE.value,
+                    money_map_subcategory="Housing",
+                ),
+                _tx(
+                    month2,
+                    1,
+                    "Rent Feb",
+                    -1200.0,
+                    money_map_type=MoneyMapType.CORE.value,
+                    money_map_subcategory="Housing",
+                ),
+            ],
         )
-        self.session.add(
-            Transaction(
-                month_id=self.month2.id,
-                date=date(2025, 2, 1),
-                description="Rent Feb",
-                amount=-1200.0,
-                money_map_type=MoneyMapType.CORE.value,
-                money_map_subcategory="Housing",
-            )
-        )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        result = repo.aggregate_by_subcategory([self.month1.id, self.month2.id])
+        month_ids = [month1.id, month2.id]
+        with count_queries(db_session.connection()) as queries:
+            result = repo.aggregate_by_subcategory(month_ids)
 
+        assert len(queries) == 1  # One GROUP BY query regardless of month count.
         assert len(result) == 1
         assert result[0][2] == 2400.0
 
-    def test_includes_income_with_positive_amounts(self) -> None:
+    def test_includes_income_with_positive_amounts(
+        self, db_session: Session, repo: TransactionRepository, two_months: tuple[Month, Month]
+    ) -> None:
         """aggregate_by_subcategory includes INCOME type with positive amounts."""
-        self.session.add(
-            Transaction(
-                month_id=self.month1.id,
-                date=date(2025, 1, 1),
-                description="Salary",
-                amount=5000.0,
-                money_map_type=MoneyMapType.INCOME.value,
-                money_map_subcategory="Job",
-            )
+        month1, _ = two_months
+        _insert_transactions(
+            db_session,
+            [_tx(month1, 1, "Salary", 5000.0, money_map_type=MoneyMapType.INCOME.value, money_map_subcategory="Job")],
         )
-        self.session.commit()
+        db_session.commit()
 
-        repo = TransactionRepository(self.session)
-        result = repo.aggregate_by_subcategory([self.month1.id])
+        result = repo.aggregate_by_subcategory([month1.id])
 
         assert len(result) == 1
         assert result[0][0] == MoneyMapType.INCOME.value
         assert result[0][2] == 5000.0
+
+
+class TestEscapeLikePattern:
+    """Test cases for the static LIKE-pattern escaping helper, which needs no database."""
+
+    def test_escape_like_pattern_escapes_wildcards(self) -> None:
+        """_escape_like_pattern escapes SQL LIKE wildcards."""
+        assert TransactionRepository._escape_like_pattern("test%value") == "test\\%value"
+        assert TransactionRepository._escape_like_pattern("test_value") == "test\\_value"
+        assert TransactionRepository._escape_like_pattern("test\\value") == "test\\\\value"
@@ -3,6 +3,7 @@
 import json
 import unittest
 
+import pytest
 from pydantic import ValidationError
 
 from app.responses.advice import AdviceData, GenerateAdviceRequest
@@ -35,14 +36,36 @@ class TestAdviceDataFromJson(unittest.TestCase):
 
         result = AdviceData.from_json(json_str)
 
-        self.assertEqual(result.analysis, "Votre gestion financière est excellente.")
-        self.assertEqual(len(result.problem_areas), 3)
-        self.assertEqual(result.problem_areas[0].category, "Subscriptions")
-        self.assertEqual(result.problem_areas[0].amount, 85.0)
-        self.assertEqual(result.problem_areas[0].trend, "+20%")
-        self.assertEqual(len(result.recommendations), 3)
-        self.assertEqual(result.recommendations[0].action, "Réduire les abonnements.")
-        self.assertEqual(result.encouragement, "Continuez comme ça!")
+        def legacy(priority: int, text: str) -> dict[str, object]:
+            return {
+                "priority": priority,
+                "action": text,
+                "details": text,
+                "expected_savings": "Non spécifié",
+                "difficulty": "Modéré",
+                "quick_win": False,
+            }
+
+        self.assertEqual(
+            result.model_dump(),
+            {
+                "analysis": "Votre gestion financière est excellente.",
+                "spending_patterns": [],
+                "problem_areas": [
+                    {"category": "Subscriptions", "amount": 85.0, "trend": "+20%", "root_cause": None, "impact": None},
+                    {"category": "Dining", "amount": 150.0, "trend": "+15%", "root_cause": None, "impact": None},
+                    {"category": "Entertainment", "amount": 120.0, "trend": "N/A", "root_cause": None, "impact": None},
+                ],
+                "recommendations": [
+                    legacy(1, "Réduire les abonnements."),
+                    legacy(2, "Limiter les repas au restaurant."),
+                    legacy(3, "Maintenir votre épargne."),
+                ],
+                "progress_review": None,
+                "monthly_goal": None,
+                "encouragement": "Continuez comme ça!",
+            },
+        )
 
     def test_parses_valid_json_string_new_format(self) -> None:
         """From JSON parses valid JSON string with new enriched format."""
@@ -105,6 +128,14 @@ class TestAdviceDataFromJson(unittest.TestCase):
         assert result.monthly_goal is not None
         self.assertEqual(result.monthly_goal.target_amount, 90.0)
 
+    def test_raises_value_error_for_invalid_json(self) -> None:
+        """From JSON raises ValueError for malformed JSON or a missing required field."""
+        with self.assertRaises(ValueError):
+            AdviceData.from_json("{not json")
+
+        with self.assertRaises(ValueError):
+            AdviceData.from_json(json.dumps({"analysis": "Sans zones à problèmes.", "encouragement": "Courage!"}))
+
 
 class TestAdviceDataFromServiceResponse(unittest.TestCase):
     """Tests for AdviceData.from_service_response factory method."""
@@ -139,50 +170,35 @@ class TestAdviceDataFromServiceResponse(unittest.TestCase):
 
         result = AdviceData.from_service_response(service_response)
 
-        self.assertEqual(result.analysis, "Test analysis")
-        self.assertEqual(len(result.problem_areas), 1)
-        self.assertEqual(result.problem_areas[0].category, "Test")
-        self.assertEqual(result.problem_areas[0].amount, 100.0)
-        self.assertEqual(result.problem_areas[0].trend, "+10%")
-        self.assertEqual(len(result.recommendations), 2)
-        self.assertEqual(result.recommendations[0].action, "Recommendation 1")
-        self.assertEqual(result.recommendations[1].action, "Recommendation 2")
-        self.assertEqual(result.encouragement, "Keep going!")
+        # ##>: The service DTO carries the same fields, so its dump is the expected API payload.
+        self.assertEqual(result.model_dump(), service_response.model_dump())
 
 
-class TestGenerateAdviceRequestValidation(unittest.TestCase):
+class TestGenerateAdviceRequestValidation:
     """Tests for GenerateAdviceRequest field validation."""
 
-    def test_validates_year_constraints(self) -> None:
+    @pytest.mark.parametrize(("year", "valid"), [(1999, False), (2000, True), (2100, True), (2101, False)])
+    def test_validates_year_constraints(self, year: int, valid: bool) -> None:
         """Request validates year is between 2000 and 2100."""
-        with self.assertRaises(ValidationError):
-            GenerateAdviceRequest(year=1999, month=1)
-
-        with self.assertRaises(ValidationError):
-            GenerateAdviceRequest(year=2101, month=1)
+        if not valid:
+            with pytest.raises(ValidationError):
+                GenerateAdviceRequest(year=year, month=1)
+            return
 
-        request = GenerateAdviceRequest(year=2000, month=1)
-        self.assertEqual(request.year, 2000)
+        assert GenerateAdviceRequest(year=year, month=1).year == year
 
-        request = GenerateAdviceRequest(year=2100, month=12)
-        self.assertEqual(request.year, 2100)
-
-    def test_validates_month_constraints(self) -> None:
+    @pytest.mark.parametrize(("month", "valid"), [(0, False), (1, True), (12, True), (13, False)])
+    def test_validates_month_constraints(self, month: int, valid: bool) -> None:
         """Request validates month is between 1 and 12."""
-        with self.assertRaises(ValidationError):
-            GenerateAdviceRequest(year=2025, month=0)
-
-        with self.assertRaises(ValidationError):
-            GenerateAdviceRequest(year=2025, month=13)
-
-        request = GenerateAdviceRequest(year=2025, month=1)
-        self.assertEqual(request.month, 1)
+        if not valid:
+            with pytest.raises(ValidationError):
+                GenerateAdviceRequest(year=2025, month=month)
+            return
 
-        request = GenerateAdviceRequest(year=2025, month=12)
-        self.assertEqual(request.month, 12)
+        assert GenerateAdviceRequest(year=2025, month=month).month == month
 
     def test_regenerate_defaults_to_false(self) -> None:
         """Request regenerate flag defaults to False."""
         request = GenerateAdviceRequest(year=2025, month=1)
 
-        self.assertFalse(request.regenerate)
+        assert request.regenerate is False
@@ -80,12 +80,9 @@ class TestCheckEligibility(DatabaseTestCase):
         """Returns is_first_advice=False when user has advice even if month ineligible."""
         month_aug = Month(year=2025, month=8)
         month_oct = Month(year=2025, month=10)
-        self.session.add_all([month_aug, month_oct])
-        self.session.commit()
-
         # ##>: User already has advice for October.
-        advice = Advice(month_id=month_oct.id, advice_text='{"test": "data"}')
-        self.session.add(advice)
+        advice = Advice(month=month_oct, advice_text='{"test": "data"}')
+        self.session.add_all([month_aug, month_oct, advice])
         self.session.commit()
 
         month_repo = MonthRepository(self.session)
@@ -114,11 +111,8 @@ class TestCheckEligibility(DatabaseTestCase):
     def test_regenerating_only_advice_returns_12_month_limit(self) -> None:
         """Returns 12 month history limit when regenerating the only advice."""
         month = Month(year=2025, month=10)
-        self.session.add(month)
-        self.session.commit()
-
-        advice = Advice(month_id=month.id, advice_text='{"test": "data"}')
-        self.session.add(advice)
+        advice = Advice(month=month, advice_text='{"test": "data"}')
+        self.session.add_all([month, advice])
         self.session.commit()
 
         month_repo = MonthRepository(self.session)
@@ -135,12 +129,9 @@ class TestCheckEligibility(DatabaseTestCase):
         """Returns 3 month history limit when other advice already exists."""
         month_sep = Month(year=2025, month=9)
         month_oct = Month(year=2025, month=10)
-        self.session.add_all([month_sep, month_oct])
-        self.session.commit()
-
         # ##>: Add advice for a different month.
-        advice = Advice(month_id=month_sep.id, advice_text='{"test": "data"}')
-        self.session.add(advice)
+        advice = Advice(month=month_sep, advice_text='{"test": "data"}')
+        self.session.add_all([month_sep, month_oct, advice])
         self.session.commit()
 
         month_repo = MonthRepository(self.session)
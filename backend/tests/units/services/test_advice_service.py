@@ -31,8 +31,7 @@ def _create_month(session: Session, year: int = 2025, month: int = 1) -> Month:
         score_label="Great",
     )
     session.add(month_record)
-    session.commit()
-    session.refresh(month_record)
+    session.flush()
     return month_record
 
 
@@ -212,7 +211,6 @@ class TestExtractAllTransactions(DatabaseTestCase):
         _create_transaction(self.session, month, "Netflix", -15.99, "CHOICE", "Subscriptions")
         _create_transaction(self.session, month, "Savings", -500.0, "COMPOUND", "Savings")
         self.session.commit()
-        self.session.refresh(month)
 
         result = advice_service._extract_all_transactions(month.transactions)
 
@@ -233,7 +231,6 @@ class TestExtractAllTransactions(DatabaseTestCase):
         _create_transaction(self.session, month, "Transfer", -100.0, "EXCLUDED")
         _create_transaction(self.session, month, "Groceries", -150.0, "CORE", "Food")
         self.session.commit()
-        self.session.refresh(month)
 
         result = advice_service._extract_all_transactions(month.transactions)
 
@@ -252,7 +249,6 @@ class TestExtractAllTransactions(DatabaseTestCase):
         _create_transaction(self.session, month, "Large", -500.0, "CORE")
         _create_transaction(self.session, month, "Medium", -100.0, "CORE")
         self.session.commit()
-        self.session.refresh(month)
 
         result = advice_service._extract_all_transactions(month.transactions)
 
@@ -273,7 +269,6 @@ class TestExtractAllTransactions(DatabaseTestCase):
         month = _create_month(self.session)
         _create_transaction(self.session, month, "Expense", -150.0, "CHOICE", "Dining")
         self.session.commit()
-        self.session.refresh(month)
 
         result = advice_service._extract_all_transactions(month.transactions)
 
@@ -416,7 +411,6 @@ class TestMonthToMonthDataWithNewFields(DatabaseTestCase):
         _create_transaction(self.session, month, "Rent", -1200.0, "CORE", "Housing")
         _create_transaction(self.session, month, "Uber Eats", -45.0, "CHOICE", "Food Delivery")
         self.session.commit()
-        self.session.refresh(month)
 
         result = advice_service.month_to_month_data(month)
 
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock
 
+from sqlalchemy import insert
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.db.models.month import Month
@@ -17,9 +18,9 @@ class TestGetMonthsHistory(DatabaseTestCase):
     def test_returns_correct_months_when_limit_less_than_available(self) -> None:
         """Should return only the requested number of months."""
         # ##>: Create 5 months.
-        for i in range(1, 6):
-            month = Month(year=2025, month=i, score=i % 4, score_label="Okay")
-            self.session.add(month)
+        self.session.execute(
+            insert(Month), [{"year": 2025, "month": i, "score": i % 4, "score_label": "Okay"} for i in range(1, 6)]
+        )
         self.session.commit()
 
         month_repo = MonthRepository(self.session)
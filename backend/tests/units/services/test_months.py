@@ -135,7 +135,7 @@ class TestGetTransactionsFiltered(DatabaseTestCase):
         super().setUp()
         self.month = Month(year=2025, month=10, score=3, score_label="Great")
         self.session.add(self.month)
-        self.session.commit()
+        self.session.flush()
 
         # ##>: Create diverse transactions for filtering tests.
         self.transactions = [